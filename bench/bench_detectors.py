@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+bench_detectors.py
+
+Offline benchmark of every haiku detector generation in this repo.
+- Builds public-domain and synthetic corpora from bench/fixtures (100K to 100M)
+- Runs each engine in a fresh process and reports tokens/sec, peak RSS and haikus
+- Saves a baseline JSON and flags later runs that got slower or changed output
+- --tokenizer picks the hkdt_v3 tokenizer backend; --agreement compares backends
+"""
+
+import argparse
+import importlib.util
+import json
+import random
+import re
+import resource
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_DIR = BENCH_DIR.parent
+FIXTURE = BENCH_DIR / "fixtures" / "pride_and_prejudice_ch1.txt"
+CORPUS_DIR = BENCH_DIR / "corpora"
+BASELINE = BENCH_DIR / "baseline.json"
+
+SIZES = {"100K": 100_000, "1M": 1_000_000, "10M": 10_000_000, "100M": 100_000_000}
+KINDS = ("public", "synthetic")
+PATTERNS = [[5, 7, 5], [3, 5, 3]]
+TOKENIZERS = ("spacy", "regex", "nltk")
+
+sys.path.insert(0, str(REPO_DIR))
+import gutenberg
+
+
+# Corpora: generated once from the checked-in fixture and kept in bench/corpora
+def fixture_body() -> str:
+    return gutenberg.read_body(FIXTURE).strip()
+
+
+def build_corpus(kind: str, size: str) -> Path:
+    path = CORPUS_DIR / f"{kind}-{size}.txt"
+    if path.exists():
+        return path
+    CORPUS_DIR.mkdir(exist_ok=True)
+    rng = random.Random(f"{kind}-{size}")
+    body = fixture_body()
+    paragraphs = [p for p in body.split("\n\n") if p.strip()]
+    vocab = re.findall(r"[A-Za-z]+", body)
+    target, written = SIZES[size], 0
+    with path.open("w", encoding="utf-8") as f:
+        f.write("*** START OF THE PROJECT GUTENBERG EBOOK BENCH ***\n\n")
+        while written < target:
+            if kind == "public":
+                para = rng.choice(paragraphs)
+            else:
+                sents = []
+                for _ in range(rng.randint(2, 6)):
+                    words = [rng.choice(vocab) for _ in range(rng.randint(4, 28))]
+                    words[0] = words[0].capitalize()
+                    sents.append(" ".join(words) + rng.choice(".!?"))
+                para = " ".join(sents)
+            written += f.write(para + "\n\n")
+        f.write("*** END OF THE PROJECT GUTENBERG EBOOK BENCH ***\n")
+    return path
+
+
+_scripts = {}
+
+
+def load_script(relpath: str, name: str):
+    if name in _scripts:
+        return _scripts[name]
+    spec = importlib.util.spec_from_file_location(name, REPO_DIR / relpath)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    _scripts[name] = module
+    return module
+
+
+# Engines: each takes the cleaned text and returns a list of haikus
+def sliding_windows_greedy(words, sizes, count_syllables, is_valid_line):
+    # hkdt_v3.sliding_windows before the prefix-sum rewrite, kept as a reference
+    total = sum(sizes)
+    for i in range(len(words) - total + 1):
+        segments, cursor = [], i
+        for sz in sizes:
+            chunk, count = [], 0
+            while cursor < len(words) and count + count_syllables(words[cursor]) <= sz:
+                chunk.append(words[cursor])
+                count += count_syllables(words[cursor])
+                cursor += 1
+            if count != sz:
+                break
+            segments.append(chunk)
+        if len(segments) == len(sizes) and all(is_valid_line(seg) for seg in segments):
+            yield [" ".join(seg) for seg in segments]
+
+
+def engine_v3_prefix(text):
+    import hkdt_v3 as hk
+    found = {}
+    for words in hk.sentences(text):
+        for h in hk.find_haikus(words, hk.form_sizes()):
+            found.setdefault(tuple(h))
+    return list(found)
+
+
+def engine_v3_greedy(text):
+    import hkdt_v3 as hk
+    found = {}
+    for words in hk.sentences(text):
+        for form in hk.form_sizes():
+            for h in sliding_windows_greedy(words, form, hk.count_syllables, hk.is_valid_line):
+                found.setdefault(tuple(h))
+    return list(found)
+
+
+def engine_v2_word(text):
+    v2 = load_script("v2/hkdt_v2_syllable_mode.py", "hkdt_v2_syllable_mode")
+    found = v2.find_word_haikus(text, PATTERNS)
+    return [h for hs in found.values() for h in hs]
+
+
+def engine_v2_line(text):
+    v2 = load_script("v2/hkdt_v2_syllable_mode.py", "hkdt_v2_syllable_mode")
+    found = v2.find_line_haikus(text, PATTERNS)
+    return [h for hs in found.values() for h in hs]
+
+
+def engine_v1_sentence(text):
+    v1 = load_script("v1/hkdt_final_project_robust.py", "hkdt_final_project_robust")
+    return v1.detect_haikus(text, PATTERNS)
+
+
+def engine_haiku3_phrase(text):
+    h3 = load_script("refoldersharedwithyouhaiku_project_local/haiku3.0.py", "haiku3")
+    return [lines for _, lines in h3.detect_haikus(text)]
+
+
+ENGINES = {
+    "v3-prefix": engine_v3_prefix,
+    "v3-greedy": engine_v3_greedy,
+    "v2-word": engine_v2_word,
+    "v2-line": engine_v2_line,
+    "v1-sentence": engine_v1_sentence,
+    "haiku3-phrase": engine_haiku3_phrase,
+}
+
+
+def corpus_body(corpus: Path) -> str:
+    return gutenberg.read_body(corpus).strip()
+
+
+# Runs in a fresh process so import cost and peak memory belong to one engine
+def run_engine(engine: str, corpus: Path, tokenizer: str) -> dict:
+    if engine.startswith("v3"):
+        import hkdt_v3 as hk
+        hk.TOKENIZER = tokenizer
+    text = corpus_body(corpus)
+    tokens = len(re.findall(r"[A-Za-z]+", text))
+    ENGINES[engine](text[:1000])  # warm-up: imports, model and table loading
+    start = time.perf_counter()
+    haikus = ENGINES[engine](text)
+    seconds = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "tokens": tokens,
+        "seconds": round(seconds, 4),
+        "tokens_per_sec": round(tokens / seconds) if seconds else 0,
+        "peak_mb": round(peak_kb / 1024, 1),
+        "haikus": len(haikus),
+    }
+
+
+# Also in a fresh process: every tokenizer backend against the first one that
+# loads (spaCy when its model is installed), word for word and sentence for sentence
+def tokenizer_agreement(corpus: Path) -> dict:
+    import hkdt_v3 as hk
+    text = corpus_body(corpus)
+    runs = {}
+    for name in TOKENIZERS:
+        try:
+            list(hk.TOKENIZERS[name](text[:1000]))  # warm-up
+            start = time.perf_counter()
+            sents = [tuple(words) for words in hk.TOKENIZERS[name](text) if words]
+            runs[name] = (sents, time.perf_counter() - start)
+        except Exception as e:
+            runs[name] = f"{type(e).__name__}: {e}"
+    loaded = [name for name, run in runs.items() if not isinstance(run, str)]
+    if not loaded:
+        return {name: {"error": run} for name, run in runs.items()}
+    ref_sents = Counter(runs[loaded[0]][0])
+    ref_words = Counter(w for sent in runs[loaded[0]][0] for w in sent)
+    out = {}
+    for name, run in runs.items():
+        if isinstance(run, str):
+            out[name] = {"error": run}
+            continue
+        sents, seconds = run
+        words = Counter(w for sent in sents for w in sent)
+        n_sents, n_words = Counter(sents), sum(words.values())
+        out[name] = {
+            "reference": loaded[0],
+            "tokens_per_sec": round(n_words / seconds) if seconds else 0,
+            "words": round(sum((words & ref_words).values()) / max(n_words, sum(ref_words.values()), 1), 4),
+            "sentences": round(sum((n_sents & ref_sents).values()) / max(len(sents), sum(ref_sents.values()), 1), 4),
+        }
+    return out
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    problems = []
+    for key, now in results.items():
+        before = baseline.get(key)
+        if not before or "error" in now or "error" in before:
+            continue
+        if now["tokens_per_sec"] < before["tokens_per_sec"] * (1 - tolerance):
+            problems.append(f"{key}: {now['tokens_per_sec']:,} tok/s vs {before['tokens_per_sec']:,} in baseline")
+        if now["haikus"] != before["haikus"]:
+            problems.append(f"{key}: {now['haikus']} haikus vs {before['haikus']} in baseline")
+    return problems
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--engines", default=",".join(ENGINES), help="Comma-separated engines to run")
+    p.add_argument("--sizes", default="100K,1M", help=f"Comma-separated corpus sizes from {','.join(SIZES)}")
+    p.add_argument("--kinds", default=",".join(KINDS), help="Corpus kinds: public, synthetic")
+    p.add_argument("--baseline", default=str(BASELINE), help="Baseline JSON to compare against")
+    p.add_argument("--save-baseline", action="store_true", help="Write this run as the new baseline")
+    p.add_argument("--tolerance", type=float, default=0.2, help="Allowed tokens/sec drop before flagging")
+    p.add_argument("--tokenizer", default="spacy", choices=TOKENIZERS, help="Tokenizer for the v3 engines")
+    p.add_argument("--agreement", action="store_true", help="Compare tokenizer backends on each corpus")
+    args = p.parse_args()
+
+    results = {}
+    ctx = get_context("spawn")
+    for kind in args.kinds.split(","):
+        for size in args.sizes.split(","):
+            corpus = build_corpus(kind, size)
+            if args.agreement:
+                with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                    agreement = pool.submit(tokenizer_agreement, corpus).result()
+                for name, r in agreement.items():
+                    key = f"tokenizer {name}/{kind}-{size}"
+                    if "error" in r:
+                        print(f"{key:<32} skipped ({r['error']})")
+                    else:
+                        print(f"{key:<32}{r['tokens_per_sec']:>12,} tok/s{r['words']:>9.2%} words"
+                              f"{r['sentences']:>9.2%} sentences vs {r['reference']}")
+            for engine in args.engines.split(","):
+                # other tokenizers find other haikus, so they get their own baseline entries
+                tagged = f"{engine}+{args.tokenizer}" if engine.startswith("v3") and args.tokenizer != "spacy" else engine
+                key = f"{tagged}/{kind}-{size}"
+                with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                    try:
+                        results[key] = pool.submit(run_engine, engine, corpus, args.tokenizer).result()
+                    except Exception as e:
+                        results[key] = {"error": f"{type(e).__name__}: {e}"}
+                r = results[key]
+                if "error" in r:
+                    print(f"{key:<32} skipped ({r['error']})")
+                else:
+                    print(f"{key:<32}{r['tokens_per_sec']:>12,} tok/s{r['peak_mb']:>10,.1f} MB{r['haikus']:>8} haikus")
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline_path.write_text(json.dumps(results, indent=2, sort_keys=True), encoding="utf-8")
+        print(f"✔ Baseline saved to {baseline_path}")
+        return
+    if baseline_path.exists():
+        problems = compare(results, json.loads(baseline_path.read_text(encoding="utf-8")), args.tolerance)
+        for line in problems:
+            print(f"⚠ regression: {line}")
+        if problems:
+            sys.exit(1)
+        print("✔ No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+standin.py
+
+Local stand-in for gutenberg.org, so hkdt_v3 downloads can be tested offline.
+- Builds a top list and one text per book in bench/site from bench/fixtures
+- Books are synthetic, seeded by their ID, so every build serves the same bytes
+- Odd IDs are served as files/{id}/{id}-0.txt, even ones as files/{id}/{id}.txt
+- Every 13th book is Latin-1 with accented words, to check downloads decode it
+- Files carry Last-Modified and answer If-Modified-Since with 304, like the real site
+- Point GUTENBERG_URL in hkdt_v3.py at the printed URL, then run hkdt_v3.py
+"""
+
+import argparse
+import functools
+import random
+import re
+import shutil
+import sys
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SITE_DIR = BENCH_DIR / "site"
+FIXTURE = BENCH_DIR / "fixtures" / "pride_and_prejudice_ch1.txt"
+ACCENTED = "The naïve café owner said déjà vu to Zoë."
+
+sys.path.insert(0, str(BENCH_DIR.parent))
+import gutenberg
+
+
+def book_text(book_id: int, sentences: int, vocab: list[str]) -> str:
+    rng = random.Random(book_id)
+    paragraphs = []
+    for _ in range(0, sentences, 5):
+        sents = []
+        for _ in range(5):
+            words = [rng.choice(vocab) for _ in range(rng.randint(5, 30))]
+            words = [w.capitalize() if rng.random() < 0.4 else w for w in words]
+            words[0] = words[0].capitalize()
+            sents.append(" ".join(words) + rng.choice(".!?"))
+        paragraphs.append(" ".join(sents))
+    return (f"Title: Book {book_id}\nAuthor: Writer {book_id}\nLanguage: English\n\n"
+            f"*** START OF THE PROJECT GUTENBERG EBOOK BOOK {book_id} ***\n\n"
+            + "\n\n".join(paragraphs)
+            + f"\n\n*** END OF THE PROJECT GUTENBERG EBOOK BOOK {book_id} ***\n")
+
+
+def build_site(books: int, sentences: int) -> Path:
+    shutil.rmtree(SITE_DIR, ignore_errors=True)
+    vocab = re.findall(r"[A-Za-z]+", gutenberg.read_body(FIXTURE))
+    items = "".join(f'<li><a href="/ebooks/{i}">Book {i} by Writer {i} ({books - i})</a></li>'
+                    for i in range(1, books + 1))
+    top = SITE_DIR / "browse" / "scores" / "top"
+    top.parent.mkdir(parents=True)
+    top.write_text(f"<html><body><h2>Top 100 EBooks yesterday</h2><ol>{items}</ol></body></html>", encoding="utf-8")
+    for i in range(1, books + 1):
+        path = SITE_DIR / "files" / str(i) / (f"{i}-0.txt" if i % 2 else f"{i}.txt")
+        path.parent.mkdir(parents=True)
+        text = book_text(i, sentences, vocab)
+        if i % 13:
+            path.write_text(text, encoding="utf-8")
+        else:
+            path.write_text(text.replace("***\n\n", f"***\n\n{ACCENTED}\n\n", 1), encoding="latin-1")
+    return SITE_DIR
+
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--books", type=int, default=24, help="Books on the top list")
+    p.add_argument("--sentences", type=int, default=1500, help="Sentences per book")
+    p.add_argument("--port", type=int, default=8000, help="Port to listen on (0 picks a free one)")
+    args = p.parse_args()
+
+    site = build_site(args.books, args.sentences)
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), functools.partial(SimpleHTTPRequestHandler, directory=str(site)))
+    print(f"✔ Serving {args.books} books from {site} at http://127.0.0.1:{server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+catalog.py
+
+Local Gutenberg catalog for book metadata, so detectors never scrape a page per book.
+- `python catalog.py` ingests pg_catalog.csv or rdf-files.tar.bz2 from disk into catalog_index.bin
+- The index is a flat array of record offsets keyed by book ID, read through one mmap
+- lookup(book_id) is a single array index: title, author and language, no parsing
+- metadata() falls back to scraping the book's page, cached on disk, for books the catalog lacks
+"""
+
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+from array import array
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+
+# Either dump from https://www.gutenberg.org/ebooks/offline_catalogs.html;
+# the first one present is used
+CATALOG_SOURCES = (BASE_DIR / "pg_catalog.csv", BASE_DIR / "rdf-files.tar.bz2")
+INDEX_FILE = BASE_DIR / "catalog_index.bin"
+PAGE_CACHE = BASE_DIR / "cache" / "catalog_pages.json"
+
+# Layout: magic, slot count (highest book ID + 1), then uint32 record offsets
+# (count + 1 of them) and the utf-8 records, "title\x1fauthor\x1flanguage".
+# A book missing from the catalog has an empty record.
+MAGIC = b"HKCAT001"
+HEADER = struct.Struct("<8sI")
+FIELDS = ("title", "author", "language")
+SEP = "\x1f"
+
+RDF_NS = {
+    "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "dcterms": "http://purl.org/dc/terms/",
+    "pgterms": "http://www.gutenberg.org/2009/pgterms/",
+}
+
+_index = None
+_index_lock = threading.Lock()
+_pages = None
+_pages_lock = threading.Lock()
+
+
+# "Austen, Jane, 1775-1817 [Editor]; Other, A." -> "Austen, Jane"
+def first_author(authors: str) -> str:
+    name = authors.split(";")[0]
+    name = re.sub(r"\s*\[[^\]]*\]", "", name)
+    name = re.sub(r",[^,]*\d[^,]*$", "", name)  # life dates
+    return " ".join(name.split())
+
+
+def csv_records(path: Path):
+    import csv
+
+    with path.open(encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            if row.get("Type", "Text") == "Text" and row["Text#"].isdigit():
+                yield int(row["Text#"]), " ".join(row["Title"].split()), first_author(row["Authors"]), row["Language"]
+
+
+def rdf_records(path: Path):
+    import tarfile
+    import xml.etree.ElementTree as ET
+
+    with tarfile.open(path, "r|*") as tar:
+        for member in tar:
+            m = re.search(r"pg(\d+)\.rdf$", member.name)
+            if not m:
+                continue
+            root = ET.parse(tar.extractfile(member)).getroot()
+            ebook = root.find("pgterms:ebook", RDF_NS)
+            if ebook is None:
+                continue
+            title = ebook.findtext("dcterms:title", "", RDF_NS)
+            author = ebook.findtext("dcterms:creator/pgterms:agent/pgterms:name", "", RDF_NS)
+            langs = [v.text for v in ebook.iterfind("dcterms:language/rdf:Description/rdf:value", RDF_NS)]
+            yield int(m.group(1)), " ".join(title.split()), first_author(author), "; ".join(filter(None, langs))
+
+
+def build_index(source: Path, path: Path = INDEX_FILE) -> Path:
+    records = csv_records(source) if source.suffix == ".csv" else rdf_records(source)
+    books = {book_id: SEP.join(fields).encode("utf-8") for book_id, *fields in records}
+    n = max(books, default=-1) + 1
+    offsets, pos, blob = array("I", [0]), 0, []
+    for book_id in range(n):
+        record = books.get(book_id, b"")
+        blob.append(record)
+        pos += len(record)
+        offsets.append(pos)
+
+    # unique per process and thread, so concurrent builds never share a file
+    tmp = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    with tmp.open("wb") as f:
+        f.write(HEADER.pack(MAGIC, n))
+        f.write(offsets.tobytes())
+        f.write(b"".join(blob))
+    tmp.replace(path)
+    return path
+
+
+def catalog_source() -> Path | None:
+    return next((p for p in CATALOG_SOURCES if p.exists()), None)
+
+
+# (map, slot count, offsets view, blob start), or None without any catalog.
+# Rebuilt when the source dump is newer than the index, by one thread only.
+def index():
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = open_index()
+    return _index
+
+
+def open_index():
+    source = catalog_source()
+    if source and (not INDEX_FILE.exists() or INDEX_FILE.stat().st_mtime < source.stat().st_mtime):
+        build_index(source)
+    if not INDEX_FILE.exists():
+        return None
+    with INDEX_FILE.open("rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, n = HEADER.unpack_from(mm)
+    if magic != MAGIC:
+        raise ValueError(f"{INDEX_FILE} is not a catalog index")
+    offsets = memoryview(mm)[HEADER.size:HEADER.size + 4 * (n + 1)].cast("I")
+    return mm, n, offsets, HEADER.size + 4 * (n + 1)
+
+
+def lookup(book_id) -> dict[str, str] | None:
+    idx = index()
+    if idx is None or not str(book_id).isdigit() or int(book_id) >= idx[1]:
+        return None
+    book_id = int(book_id)
+    mm, _, offsets, blob = idx
+    record = mm[blob + offsets[book_id]:blob + offsets[book_id + 1]]
+    return dict(zip(FIELDS, record.decode("utf-8").split(SEP))) if record else None
+
+
+# Fallback for books the catalog lacks: the title and author from the book's
+# page, cached in PAGE_CACHE so each page is fetched at most once
+def scrape_page(book_id) -> dict[str, str] | None:
+    import requests
+    from bs4 import BeautifulSoup
+
+    try:
+        r = requests.get(f"https://www.gutenberg.org/ebooks/{book_id}", timeout=10)
+        r.raise_for_status()
+    except requests.RequestException:
+        return None
+    soup = BeautifulSoup(r.text, "html.parser")
+    title = soup.select_one("meta[name='title']") or soup.select_one("h1")
+    author = soup.select_one("meta[name='author']") or soup.select_one("h2")
+    if title is None:
+        return None
+    return {"title": " ".join(tag_text(title).split()), "author": first_author(tag_text(author)) if author else "", "language": ""}
+
+
+def tag_text(tag) -> str:
+    return tag.get("content", "") if tag.name == "meta" else tag.get_text(" ", strip=True)
+
+
+def cached_page(book_id) -> dict[str, str] | None:
+    global _pages
+    key = str(book_id)
+    with _pages_lock:
+        if _pages is None:
+            try:
+                _pages = json.loads(PAGE_CACHE.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                _pages = {}
+        if key in _pages:
+            return _pages[key]
+    meta = scrape_page(book_id)
+    if meta:
+        with _pages_lock:
+            _pages[key] = meta
+            PAGE_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            tmp = PAGE_CACHE.with_suffix(".tmp")
+            tmp.write_text(json.dumps(_pages, indent=1, sort_keys=True), encoding="utf-8")
+            tmp.replace(PAGE_CACHE)
+    return meta
+
+
+# Title, author and language of a book: the local catalog first, its web page second
+def metadata(book_id) -> dict[str, str] | None:
+    return lookup(book_id) or cached_page(book_id)
+
+
+if __name__ == "__main__":
+    source = catalog_source()
+    if source is None:
+        raise SystemExit(f"✖ No catalog dump found; download one of: {', '.join(p.name for p in CATALOG_SOURCES)}")
+    out = build_index(source)
+    print(f"✔ Catalog index written to {out}")
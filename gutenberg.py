@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+gutenberg.py
+
+Project Gutenberg boilerplate stripping shared by every detector in this repo.
+- One forward pass finds the START marker, then the END marker after it
+- Knows the older markers too: "START OF THIS PROJECT GUTENBERG", "End of
+  Project Gutenberg's ..." and the "*END*THE SMALL PRINT!" header of old etexts
+- body_span() returns offsets, so callers slice or view the original buffer
+  instead of splitting the whole book into lines
+- Saved files are read through a memory map and only the body is decoded
+- Text without markers (e.g. a file saved already stripped) passes through whole
+"""
+
+import mmap
+import re
+from contextlib import contextmanager
+from pathlib import Path
+
+START = r"\bstart of (?:the |this )?project gutenberg|\*end\*? ?the small print!"
+END = r"\bend of (?:the |this )?project gutenberg"
+
+# str patterns for decoded text, bytes patterns for files and memory maps
+PATTERNS = {
+    str: (re.compile(START, re.IGNORECASE), re.compile(END, re.IGNORECASE), "\n"),
+    bytes: (re.compile(START.encode(), re.IGNORECASE), re.compile(END.encode(), re.IGNORECASE), b"\n"),
+}
+
+
+# (start, end) of the body: from the line after the START marker up to the
+# line holding the END marker. Works on str, bytes and mmap alike.
+def body_span(buf) -> tuple[int, int]:
+    start_re, end_re, nl = PATTERNS[str if isinstance(buf, str) else bytes]
+    start, end = 0, len(buf)
+    m = start_re.search(buf)
+    if m:
+        eol = buf.find(nl, m.end())
+        start = end if eol == -1 else eol + 1
+    m = end_re.search(buf, start)
+    if m:
+        end = buf.rfind(nl, start, m.start()) + 1 or start
+    return start, end
+
+
+def strip(text: str) -> str:
+    start, end = body_span(text)
+    return text[start:end]
+
+
+# Yields a memoryview of the body of a file on disk, valid inside the block
+@contextmanager
+def mapped_body(path: Path):
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            yield memoryview(b"")
+            return
+    start, end = body_span(mm)
+    whole = memoryview(mm)
+    view = whole[start:end]
+    try:
+        yield view
+    finally:
+        # the views must go before the map can close
+        view.release()
+        whole.release()
+        mm.close()
+
+
+# The body of a file as text, with newlines translated like read_text() does
+def read_body(path: Path) -> str:
+    with mapped_body(path) as view:
+        text = str(view, "utf-8", "ignore")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
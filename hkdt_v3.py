@@ -1,38 +1,126 @@
+import resources  # first, so its clock starts as close to process start as possible
+
+import functools
+import hashlib
+import json
+import mmap
+import multiprocessing
+import os
+import queue
 import re
+import struct
+import threading
+import time
 import requests
 from bs4 import BeautifulSoup
+from importlib import metadata
 from pathlib import Path
-from collections import deque
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+from array import array
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 
-import nltk
-import spacy
-from langdetect import detect, LangDetectException
-from nltk.corpus import cmudict
 from tqdm import tqdm
 
-# Initialize resources
-nltk.download("cmudict", quiet=True)
-syllable_dict = cmudict.dict()
-# Load spaCy small model with sentencizer
-nlp = spacy.load("en_core_web_sm", disable=["parser", "ner"])
-nlp.max_length = 5_000_000  # allow longer texts
-nlp.add_pipe("sentencizer")
+import catalog
+import gutenberg
+import language
+import syllables
+import timings
+import tokenizer_backends
 
 # Paths & URLs
 BASE_DIR = Path(__file__).parent
 TEXT_DIR = BASE_DIR / "texts"
 RESULT_DIR = BASE_DIR / "results"
 ZINE_FILE = RESULT_DIR / "haiku_zine.md"
-TOP_URL = "https://www.gutenberg.org/browse/scores/top"
+CACHE_DIR = BASE_DIR / "cache"
+RESULTS_CACHE = CACHE_DIR / "results.json"
+TOKEN_DIR = CACHE_DIR / "tokens"
+MANIFEST_FILE = CACHE_DIR / "manifest.json"
+TOP_PAGE = CACHE_DIR / "top.html"
+TIMINGS_FILE = RESULT_DIR / "timings.json"
+GUTENBERG_URL = "https://www.gutenberg.org"  # or bench/standin.py, to test downloads offline
+
+# Form registry: syllables per line for every form the detector knows.
+# FORMS picks the ones to scan for; all of them are matched in a single pass.
+FORM_REGISTRY = {
+    "haiku": (5, 7, 5),
+    "short haiku": (3, 5, 3),
+    "senryu": (5, 7, 5),
+    "tanka": (5, 7, 5, 7, 7),
+    "cinquain": (2, 4, 6, 8, 2),
+}
+FORMS = ("haiku", "short haiku")
+
+# Bump FILTER_VERSION whenever valid_span changes so cached results from
+# the old filters are thrown away
+FILTER_VERSION = 1
 
 # Limits
 MAX_BOOKS = 100
-TARGET_HAIKU_COUNT = 100
+# Haiku budget for quick sample zines, e.g. 100: once this many haikus are
+# found, downloads and scans still running stop, and the zine holds the first
+# ones by rank. Which books finish first depends on timing, so such a zine
+# differs from run to run. 0 scans every book for the same zine every run.
+TARGET_HAIKU_COUNT = 0
+BUDGET_POLL = 0.5  # seconds between budget checks while waiting on downloads
+SYLLABLE_CACHE_SIZE = 100_000
+SCAN_WORKERS = os.cpu_count() or 1  # 1 scans books in a thread of this process
+# Books of more than 2 * SHARD_CHARS are cut into shards of about that size
+# and scanned by all pool workers at once. Each shard is tokenized with
+# SHARD_OVERLAP characters of context on both sides, doubled when a sentence
+# runs past it, so no window is lost at a cut.
+SHARD_CHARS = 1_000_000
+SHARD_OVERLAP = 20_000
+# Books wait for a scanner in order of estimated cost, largest first, so no
+# big book starts last and holds up the end of the run. The cost is the token
+# count in the book's token cache, else its size over BYTES_PER_TOKEN.
+BYTES_PER_TOKEN = 6
+
+# Pipeline: download, language check, cache key, scan and write all run at
+# once, each stage with its own workers. Stages hand books on through queues
+# of at most PIPELINE_QUEUE books, so a slow stage holds back the ones before it.
+PIPELINE_QUEUE = 4
+LANGUAGE_WORKERS = 1
+KEY_WORKERS = 2
+WRITE_WORKERS = 1
+
+# Downloads
+DOWNLOAD_WORKERS = 8
+HOST_RATE_LIMIT = 4.0  # requests per second to any one host
+DOWNLOAD_TIMEOUT = (5, 30)  # connect, read seconds
+# Books already in TEXT_DIR are skipped without a request; True revalidates
+# them with a conditional GET instead, to pick up texts changed upstream
+REVALIDATE_DOWNLOADS = False
+
+# Tokenizer: "spacy", or the much faster "regex", or "nltk". spaCy reads
+# books in paragraph-aligned chunks so memory stays flat however long they are
+TOKENIZER = "spacy"
+SPACY_MODEL = "en_core_web_sm"
+CHUNK_CHARS = 20_000
+PIPE_BATCH = 8  # chunks per nlp.pipe batch
 
 # Ensure directories exist
 TEXT_DIR.mkdir(parents=True, exist_ok=True)
 RESULT_DIR.mkdir(parents=True, exist_ok=True)
+CACHE_DIR.mkdir(parents=True, exist_ok=True)
+TOKEN_DIR.mkdir(parents=True, exist_ok=True)
+
+# Heavy resources are loaded on first use, so cached runs never pay for them
+_nlp = None
+
+
+def get_nlp():
+    # spaCy small model with sentencizer
+    global _nlp
+    if _nlp is None:
+        with resources.loading(f"spaCy {SPACY_MODEL}"):
+            import spacy
+            _nlp = spacy.load(SPACY_MODEL, disable=["parser", "ner"])
+            _nlp.add_pipe("sentencizer")
+    return _nlp
+
 
 # Utilities
 def clean_filename(name: str) -> str:
@@ -40,152 +128,980 @@ def clean_filename(name: str) -> str:
 
 
 def count_syllables(word: str) -> int:
-    w = word.lower()
-    if w in syllable_dict:
-        return min(len([s for s in pron if s[-1].isdigit()]) for pron in syllable_dict[w])
-    return len(re.findall(r"[aeiouy]+", w)) or 1
+    return syllables.count_syllables(word, minimum=1)
 
 
-def is_valid_line(words: list[str]) -> bool:
-    if len(words) < 2:
+# Line filters work from per-token flags, computed once per distinct word,
+# so candidate lines are checked without joining or rescanning any text
+HAS_DIGIT, STARTS_UPPER = 1, 2
+
+
+@functools.lru_cache(maxsize=SYLLABLE_CACHE_SIZE)
+def token_flags(word: str) -> int:
+    flags = 0
+    if any(char.isdigit() for char in word):
+        flags |= HAS_DIGIT
+    if word[:1].isupper():
+        flags |= STARTS_UPPER
+    return flags
+
+
+# Flags and running character counts for a sentence
+def line_features(words: list[str]) -> tuple[list[int], list[int]]:
+    flags, chars = [], [0]
+    for w in words:
+        flags.append(token_flags(w))
+        chars.append(chars[-1] + len(w))
+    return flags, chars
+
+
+# words[a:b] makes a valid line: two or more words, no digits, a capital
+# first letter and at least 5 characters once joined with spaces
+def valid_span(flags: list[int], chars: list[int], a: int, b: int) -> bool:
+    if b - a < 2 or not flags[a] & STARTS_UPPER:
         return False
-    if any(char.isdigit() for w in words for char in w):
+    if chars[b] - chars[a] + (b - a - 1) < 5:
         return False
-    line = " ".join(words)
-    return line[0].isupper() and len(line) >= 5
+    return not any(flags[k] & HAS_DIGIT for k in range(a, b))
 
 
-def sliding_windows(words: list[str], sizes: tuple[int, ...]):
-    total = sum(sizes)
-    for i in range(len(words) - total + 1):
-        segments, cursor = [], i
+def is_valid_line(words: list[str]) -> bool:
+    flags, chars = line_features(words)
+    return valid_span(flags, chars, 0, len(words))
+
+
+# Running syllable totals for a sentence, plus the last index reaching each total
+def syllable_prefix(words: list[str]) -> tuple[list[int], dict[int, int]]:
+    return prefix_sums([count_syllables(w) for w in words])
+
+
+def prefix_sums(counts) -> tuple[list[int], dict[int, int]]:
+    prefix, last, total = [0], {0: 0}, 0
+    for idx, n in enumerate(counts, 1):
+        total += n
+        prefix.append(total)
+        last[total] = idx
+    return prefix, last
+
+
+# One pass per sentence for every form: same lines as running sliding_windows
+# once per form, but each word's syllables are only counted once.
+def find_haikus(words: list[str], forms):
+    prefix, last = syllable_prefix(words)
+    yield from match_windows(words, prefix, last, forms)
+
+
+def register_form(name: str, sizes: tuple[int, ...]):
+    FORM_REGISTRY[name] = tuple(sizes)
+
+
+def form_sizes(names=None) -> tuple[tuple[int, ...], ...]:
+    return tuple(FORM_REGISTRY[name] for name in (names or FORMS))
+
+
+# Forms become a trie keyed by line size, so forms sharing opening lines
+# (haiku and tanka, or haiku and senryu) check those lines only once.
+@functools.lru_cache(maxsize=None)
+def compile_forms(forms: tuple[tuple[int, ...], ...]) -> dict:
+    root = {'end': None, 'next': {}}
+    for sizes in forms:
+        node = root
         for sz in sizes:
-            chunk, count = [], 0
-            while cursor < len(words) and count + count_syllables(words[cursor]) <= sz:
-                chunk.append(words[cursor])
-                count += count_syllables(words[cursor])
-                cursor += 1
-            if count != sz:
-                break
-            segments.append(chunk)
-        if len(segments) == len(sizes) and all(is_valid_line(seg) for seg in segments):
-            yield [" ".join(seg) for seg in segments]
-
-# Download helper
-def download_text(link) -> Path | None:
+            node = node['next'].setdefault(sz, {'end': None, 'next': {}})
+        node['end'] = sizes
+    return root
+
+
+# Greedy line filling ends each line at the last word that keeps its total
+# <= the target, so a line fits only when that exact running total exists.
+# Candidates are (start, end) spans; text is only joined for a full match.
+def match_windows(words, prefix, last, forms):
+    root = compile_forms(tuple(forms))
+    n = len(words)
+    shortest = min(map(sum, forms), default=n + 1)
+    if n < shortest:
+        return
+    flags, chars = line_features(words)
+    for i in range(n - shortest + 1):
+        stack = [(root, i, [])]
+        while stack:
+            node, cursor, spans = stack.pop()
+            sizes = node['end']
+            # like sliding_windows, a form never starts fewer than sum(sizes)
+            # words before the end of the sentence
+            if sizes and i <= n - sum(sizes):
+                yield [" ".join(words[a:b]) for a, b in spans]
+            for sz, child in reversed(node['next'].items()):
+                end = last.get(prefix[cursor] + sz)
+                if end is not None and valid_span(flags, chars, cursor, end):
+                    stack.append((child, end, spans + [(cursor, end)]))
+
+
+def sliding_windows(words: list[str], sizes: tuple[int, ...]):
+    yield from find_haikus(words, (sizes,))
+
+# Book manifest: what is known about each book, keyed by its Gutenberg path
+# ("ebooks/84") or, for texts that were not downloaded here, by file name.
+# Download threads update it, so every access goes through the lock.
+_manifest: dict[str, dict] = {}
+_manifest_lock = threading.Lock()
+
+
+def load_manifest():
+    global _manifest
+    try:
+        data = json.loads(MANIFEST_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        data = {}
+    with _manifest_lock:
+        _manifest = data
+
+
+# Written after every download too, so an interrupted run resumes from here
+def save_manifest():
+    with _manifest_lock:
+        tmp = MANIFEST_FILE.with_suffix('.tmp')
+        tmp.write_text(json.dumps(_manifest, indent=1, sort_keys=True), encoding='utf-8')
+        tmp.replace(MANIFEST_FILE)
+
+
+def manifest_get(key: str) -> dict:
+    with _manifest_lock:
+        return dict(_manifest.get(key, {}))
+
+
+def manifest_update(key: str, **fields):
+    with _manifest_lock:
+        _manifest.setdefault(key, {}).update(fields)
+
+
+def manifest_key(path: Path) -> str:
+    with _manifest_lock:
+        for key, entry in _manifest.items():
+            if entry.get('file') == path.name:
+                return key
+    return path.name
+
+
+def classify_language(book: str, text: str, header: str | None = None) -> dict:
+    sample = language.sample(text)
+    with timings.timed('language', book, bytes=len(sample)):
+        return language.classify(sample, header)
+
+
+# English gate for a saved text: the manifest verdict stands while the file
+# is unchanged, so a book is only ever classified once
+def is_english(path: Path) -> bool:
+    key = manifest_key(path)
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    entry = manifest_get(key)
+    if 'language' not in entry or entry.get('sha256') != digest:
+        start, end = gutenberg.body_span(data)
+        header = entry.get('language_header') or language.header_language(data[:start].decode('utf-8', errors='ignore'))
+        verdict = classify_language(path.name, data[start:end].decode('utf-8', errors='ignore'), header)
+        manifest_update(key, file=path.name, sha256=digest, language=verdict)
+        return verdict['english']
+    return entry['language']['english']
+
+# HTTP helpers: one keep-alive session per download thread, and requests to
+# the same host spaced out to HOST_RATE_LIMIT per second across all threads
+_http = threading.local()
+_host_lock = threading.Lock()
+_host_next: dict[str, float] = {}
+
+
+def http_session() -> requests.Session:
+    session = getattr(_http, 'session', None)
+    if session is None:
+        session = _http.session = requests.Session()
+    return session
+
+
+def wait_for_host(url: str):
+    host = urlsplit(url).netloc
+    with _host_lock:
+        now = time.monotonic()
+        start = max(now, _host_next.get(host, now))
+        _host_next[host] = start + 1 / HOST_RATE_LIMIT
+    if start > now:
+        time.sleep(start - now)
+
+
+def http_get(url: str, headers: dict | None = None) -> requests.Response:
+    wait_for_host(url)
+    return http_session().get(url, headers=headers, timeout=DOWNLOAD_TIMEOUT)
+
+
+# Validators saved from one response and sent back as a conditional GET, so
+# an unchanged resource comes back as an empty 304
+def validators(r: requests.Response) -> dict:
+    return {'etag': r.headers.get('ETag'), 'last_modified': r.headers.get('Last-Modified')}
+
+
+def conditional_headers(entry: dict) -> dict:
+    headers = {}
+    if entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+# Download helper: books are saved whole, markers included, and the scanners
+# strip the boilerplate on read, so a saved file is only ever stripped once.
+# They are saved as UTF-8 whatever the served charset, since that is how the
+# scanners read them back.
+# Returns the saved path (or None) and how the book was fetched.
+def download_text(link) -> tuple[Path | None, str]:
     href = link.get('href', '')
     if not href.startswith('/ebooks/'):
-        return None
+        return None, 'skipped'
     book_id = href.rsplit('/', 1)[-1]
-    for suffix in ('-0.txt', '.txt'):
-        url = f"https://www.gutenberg.org/files/{book_id}/{book_id}{suffix}"
+    book = f"ebooks/{book_id}"
+    entry = manifest_get(book)
+    out = TEXT_DIR / entry['file'] if 'file' in entry else None
+    present = out is not None and out.is_file() and out.stat().st_size == entry.get('size')
+    if present and not REVALIDATE_DOWNLOADS:
+        return out, 'present'
+    # the local catalog, when there is one, turns away other languages unfetched
+    meta = catalog.lookup(book_id)
+    if meta and meta['language'] and 'en' not in meta['language'].replace(' ', '').split(';'):
+        manifest_update(book, language={'english': False, 'method': 'catalog', 'detected': meta['language']})
+        return None, 'skipped'
+    # a 304 is only useful when its answer is already here: the saved file, or
+    # the verdict on a book that was turned away
+    known = 'language' in entry and (present or not entry['language']['english'])
+    urls = [f"{GUTENBERG_URL}/files/{book_id}/{book_id}{suffix}" for suffix in ('-0.txt', '.txt')]
+    if entry.get('url') in urls:
+        urls.remove(entry['url'])
+        urls.insert(0, entry['url'])
+    for url in urls:
         try:
-            r = requests.get(url, timeout=10)
+            headers = conditional_headers(entry) if known and url == entry.get('url') else None
+            with timings.timed('download', book) as c:
+                r = http_get(url, headers)
+                c['bytes'] = len(r.content)
+            if r.status_code == 304:
+                return (out if present else None), 'not modified'
             if r.status_code != 200 or not r.text:
                 continue
-            snippet = r.text[:2000]
-            try:
-                if detect(snippet) != 'en':
-                    return None
-            except LangDetectException:
-                return None
-            lines = r.text.splitlines()
-            body, main = [], False
-            for ln in lines:
-                low = ln.strip().lower()
-                if 'start of the project gutenberg' in low:
-                    main = True
-                    continue
-                if 'end of the project gutenberg' in low:
-                    break
-                if main:
-                    body.append(ln)
-            clean_text = "\n".join(body)
-            if not clean_text.strip():
-                return None
-            header = lines[:200]
-            author = next((line.split(':',1)[1].strip() for line in header if line.lower().startswith('author:')), 'Unknown')
+            text = r.text
+            with timings.timed('strip', book, bytes=len(text)):
+                start, end = gutenberg.body_span(text)
+            if not text[start:end].strip():
+                return None, 'skipped'
+            header = language.header_language(text)
+            verdict = classify_language(book, text[start:end], header)
+            manifest_update(book, url=url, language=verdict, language_header=header, **validators(r))
+            if not verdict['english']:
+                save_manifest()
+                return None, 'downloaded'
+            author = next((line.split(':',1)[1].strip() for line in text[:start].splitlines()
+                           if line.lower().startswith('author:')), 'Unknown')
             raw = link.text.strip()
             title, _, _ = raw.partition(' by ')
             fname = clean_filename(f"{author} - {title}.txt")
             out = TEXT_DIR / fname
-            out.write_text(clean_text, encoding='utf-8')
-            return out
+            # written under a temporary name first, so an interrupted run never
+            # leaves a partial file that looks complete
+            data = text.encode('utf-8')
+            tmp = out.with_suffix('.part')
+            tmp.write_bytes(data)
+            tmp.replace(out)
+            manifest_update(book, file=out.name, size=len(data), sha256=hashlib.sha256(data).hexdigest(),
+                            title=title, author=author)
+            save_manifest()
+            timings.rename(book, out.name)
+            return out, 'downloaded'
         except:
             continue
-    return None
+    return None, 'failed'
 
 # Fetch top texts
-def fetch_top_texts():
+def fetch_top_texts(send):
     print('📕 Starting Gutenberg download…')
-    r = requests.get(TOP_URL, timeout=10)
-    soup = BeautifulSoup(r.text, 'html.parser')
+    # the list page is kept in TOP_PAGE and only sent again when it changed
+    # built here, so a GUTENBERG_URL changed after import is honoured
+    top_url = f"{GUTENBERG_URL}/browse/scores/top"
+    entry = manifest_get('top') if TOP_PAGE.exists() else {}
+    with timings.timed('download') as c:
+        r = http_get(top_url, conditional_headers(entry))
+        c['bytes'] = len(r.content)
+    if r.status_code == 304:
+        page = TOP_PAGE.read_text(encoding='utf-8')
+    else:
+        page = r.text
+        TOP_PAGE.write_text(page, encoding='utf-8')
+        manifest_update('top', url=top_url, **validators(r))
+    soup = BeautifulSoup(page, 'html.parser')
     headers = [h for h in soup.find_all('h2') if 'Top 100 EBooks' in h.text]
-    links = []
+    links = {}
     for hdr in headers[:2]:
         ol = hdr.find_next_sibling('ol')
         if ol:
-            links.extend(ol.find_all('a', href=True))
-    saved = 0
-    for link in tqdm(links, total=MAX_BOOKS, desc='Downloading', leave=False):
-        if saved >= TARGET_HAIKU_COUNT:
-            break
-        path = download_text(link)
-        if path:
-            saved += 1
-    print(f"✅ Completed downloads: {saved} texts saved to {TEXT_DIR}")
+            # both lists share most books; each is fetched once
+            for a in ol.find_all('a', href=True):
+                links.setdefault(a['href'], a)
+    # Each book is handed to `send` with its rank on the list as soon as it
+    # lands, while the other workers keep downloading.
+    # Once MAX_BOOKS are saved or the haiku budget is met, queued downloads
+    # are cancelled and the ones in flight are left to finish on their own.
+    saved, fetched = 0, Counter()
+    pool = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS)
+    try:
+        futures = {pool.submit(download_text, link): rank for rank, link in enumerate(links.values())}
+        pending = set(futures)
+        with tqdm(total=len(futures), desc='Downloading', leave=False) as bar:
+            while pending and saved < MAX_BOOKS and not budget_reached():
+                finished, pending = wait(pending, timeout=BUDGET_POLL, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    out, how = fut.result()
+                    fetched[how] += 1
+                    bar.update()
+                    if out:
+                        saved += 1
+                        send((0, futures[fut]), out)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    save_manifest()
+    print(f"✅ Completed downloads: {saved} texts saved to {TEXT_DIR} "
+          f"({fetched['downloaded']} downloaded, {fetched['present']} already present, "
+          f"{fetched['not modified']} not modified)")
 
-# Scan helper
-def scan_file(path: Path) -> list[list[str]]:
-    text = path.read_text(errors='ignore')
+# Haiku budget: haikus found so far by every scanner, in a counter shared with
+# the pool workers, which check it between sentences
+_found = None
+
+
+def budget_reached() -> bool:
+    return bool(TARGET_HAIKU_COUNT) and _found is not None and _found.value >= TARGET_HAIKU_COUNT
+
+
+def count_found(n: int):
+    if _found is not None and n:
+        with _found.get_lock():
+            _found.value += n
+
+# Streaming tokenizer
+def chunk_ends(text: str, size: int):
+    # Cuts only at whitespace, preferably a blank line, so every chunk
+    # tokenizes exactly like the same span of the whole text
+    start = 0
+    while start < len(text):
+        end = text.find("\n\n", start + size)
+        if end == -1 or end - start > 2 * size:
+            end = text.find("\n", start + size)
+        if end == -1:
+            end = len(text)
+        yield end
+        start = end
+
+
+def text_chunks(text: str, size: int = CHUNK_CHARS):
+    start = 0
+    for end in chunk_ends(text, size):
+        yield text[start:end]
+        start = end
+
+
+def sentence_open(sent, punct_chars) -> bool:
+    # Replays the sentencizer's rule from the end of a chunk: the sentence is
+    # closed if a sentence-ending mark follows its last ordinary token
+    for tok in reversed(sent):
+        if tok.text in punct_chars:
+            return False
+        if not tok.is_punct:
+            return True
+    return True
+
+
+# Yields the alphabetic words of each sentence as chunks come out of nlp.pipe.
+# A sentence left open at the end of one chunk is joined to the first
+# sentence of the next, so the result matches running nlp() on the whole text.
+def stream_sentences(text: str):
+    nlp = get_nlp()
+    punct_chars = nlp.get_pipe("sentencizer").punct_chars
+    carry = []
+    for doc in nlp.pipe(text_chunks(text, CHUNK_CHARS), batch_size=PIPE_BATCH):
+        sents = list(doc.sents)
+        for i, sent in enumerate(sents):
+            words = [w.text for w in sent if w.is_alpha]
+            if i == 0:
+                words, carry = carry + words, []
+            if i == len(sents) - 1 and sentence_open(sent, punct_chars):
+                carry = words
+                continue
+            yield words
+    if carry:
+        yield carry
+
+
+# Every backend yields the alphabetic words of each sentence; TOKENIZER picks one
+TOKENIZERS = {"spacy": stream_sentences, **tokenizer_backends.SENTENCE_BACKENDS}
+
+
+def sentences(text: str):
+    return TOKENIZERS[TOKENIZER](text)
+
+# Token cache: each book's tokens and syllable counts as flat binary arrays in
+# TOKEN_DIR, so a re-run that only changes forms or filters never tokenizes.
+# Layout: magic, key, token count, sentence count, then uint32 token offsets
+# into the stripped text, uint32 sentence starts (count + 1 of them), uint16
+# token lengths and uint8 syllable counts.
+TOKEN_MAGIC = b"HKTOK001"
+TOKEN_HEADER = struct.Struct("<8s32sII")
+
+
+# Changes with the text, the tokenizer or the syllable table
+def token_cache_key(body: str) -> bytes:
+    parts = [hashlib.sha256(body.encode('utf-8')).hexdigest(), tokenizer_fingerprint(), syllables.table_fingerprint()]
+    return hashlib.sha256("/".join(parts).encode()).hexdigest()[:32].encode()
+
+
+def token_arrays() -> dict:
+    return {'starts': array('I'), 'bounds': array('I', [0]), 'lengths': array('H'), 'counts': array('B'), 'pos': 0}
+
+
+def add_tokens(arrays: dict, body: str, words: list[str], counts: list[int]):
+    # every backend returns words in text order, so each is found after the last
+    for w, n in zip(words, counts):
+        start = body.index(w, arrays['pos'])
+        arrays['starts'].append(start)
+        arrays['lengths'].append(len(w))
+        arrays['counts'].append(min(n, 255))
+        arrays['pos'] = start + len(w)
+    arrays['bounds'].append(len(arrays['starts']))
+
+
+def write_token_cache(path: Path, key: bytes, arrays: dict):
+    tmp = path.with_suffix('.tmp')
+    with tmp.open('wb') as f:
+        f.write(TOKEN_HEADER.pack(TOKEN_MAGIC, key, len(arrays['starts']), len(arrays['bounds']) - 1))
+        for name in ('starts', 'bounds', 'lengths', 'counts'):
+            f.write(arrays[name].tobytes())
+    tmp.replace(path)
+
+
+# Returns a generator of (words, syllable counts) per sentence read through a
+# memory map, or None when there is no cache file for this key
+def read_token_cache(path: Path, key: bytes, body: str):
     try:
-        if detect(text[:2000]) != 'en':
-            return []
-    except:
-        return []
-    lines = text.splitlines()
-    body, main = [], False
-    for ln in lines:
-        low = ln.strip().lower()
-        if 'start of the project gutenberg' in low:
-            main = True
-            continue
-        if 'end of the project gutenberg' in low:
+        with path.open('rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(mm) < TOKEN_HEADER.size or TOKEN_HEADER.unpack_from(mm)[:2] != (TOKEN_MAGIC, key):
+        mm.close()
+        return None
+    return cached_sentences(mm, body)
+
+
+def token_cache_valid(path: Path, key: bytes) -> bool:
+    try:
+        with path.open('rb') as f:
+            head = f.read(TOKEN_HEADER.size)
+    except OSError:
+        return False
+    return len(head) == TOKEN_HEADER.size and TOKEN_HEADER.unpack(head)[:2] == (TOKEN_MAGIC, key)
+
+
+def cached_sentences(mm: mmap.mmap, body: str):
+    _, _, n, m = TOKEN_HEADER.unpack_from(mm)
+    view = memoryview(mm)
+    pos = TOKEN_HEADER.size
+    starts = view[pos:pos + 4 * n].cast('I')
+    pos += 4 * n
+    bounds = view[pos:pos + 4 * (m + 1)].cast('I')
+    pos += 4 * (m + 1)
+    lengths = view[pos:pos + 2 * n].cast('H')
+    counts = view[pos + 2 * n:pos + 3 * n]
+    try:
+        for s in range(m):
+            a, b = bounds[s], bounds[s + 1]
+            yield [body[starts[k]:starts[k] + lengths[k]] for k in range(a, b)], counts[a:b].tolist()
+    finally:
+        # the views must go before the map can close
+        for v in (starts, bounds, lengths, counts, view):
+            v.release()
+        mm.close()
+
+# Scan helper
+# Scans each (words, counts) sentence from `source`; counts is None for fresh
+# tokens, which are then counted and added to `arrays` for the token cache.
+# `owns(arrays)` is asked after each sentence is added; shards use it to skip
+# the sentences another shard scans. Finds count against the haiku budget as
+# they are made unless `count` is off; the scan stops early once the budget
+# is met, and the result is then incomplete and no tokens are returned.
+def scan_sentences(book: str, body: str, source, arrays: dict | None, stage: str, owns=None, count: bool = True):
+    # dict keeps first-seen order so every run writes the same zine
+    found, forms = {}, form_sizes()
+    # Sentences are tiny, so tokenizer, syllable and detection time is summed
+    # locally and recorded once per book.
+    tok = {'wall': 0.0, 'cpu': 0.0, 'bytes': len(body), 'tokens': 0}
+    syl = {'wall': 0.0, 'cpu': 0.0, 'tokens': 0}
+    det = {'wall': 0.0, 'cpu': 0.0, 'tokens': 0, 'candidates': 0}
+    sents = iter(tqdm(source, desc='Scanning', leave=False, disable=_in_worker))
+    complete = True
+    while True:
+        if budget_reached():
+            complete = False
+            break
+        tw, tc = time.perf_counter(), time.thread_time()
+        words, counts = next(sents, (None, None))
+        t0, c0 = time.perf_counter(), time.thread_time()
+        tok['wall'] += t0 - tw
+        tok['cpu'] += c0 - tc
+        if words is None:
             break
-        if main:
-            body.append(ln)
-    found = set()
-    for sent in tqdm(nlp("\n".join(body)).sents, desc='Scanning', leave=False):
-        words = [w.text for w in sent if w.is_alpha]
-        for form in ((5,7,5),(3,5,3)):
-            for h in sliding_windows(words, form):
-                found.add(tuple(h))
-    return [list(h) for h in found]
+        tok['tokens'] += len(words)
+        if counts is None:
+            counts = [count_syllables(w) for w in words]
+            if arrays:
+                try:
+                    add_tokens(arrays, body, words, counts)
+                except (ValueError, OverflowError):
+                    arrays = None  # a word not found verbatim, or too long: skip caching
+        if owns and not owns(arrays):
+            continue
+        prefix, last = prefix_sums(counts)
+        t1, c1 = time.perf_counter(), time.thread_time()
+        n = len(found)
+        for h in match_windows(words, prefix, last, forms):
+            found.setdefault(tuple(h))
+        if count:
+            count_found(len(found) - n)
+        t2, c2 = time.perf_counter(), time.thread_time()
+        syl['wall'] += t1 - t0
+        syl['cpu'] += c1 - c0
+        det['wall'] += t2 - t1
+        det['cpu'] += c2 - c1
+        syl['tokens'] += len(words)
+        det['tokens'] += len(words)
+        det['candidates'] += sum(max(0, len(words) - sum(f) + 1) for f in forms)
+    timings.add(stage, book, **tok)
+    timings.add('syllables', book, **syl)
+    timings.add('detect', book, haikus=len(found), **det)
+    return [list(h) for h in found], arrays if complete else None, complete
+
+
+# (haikus, whether the whole book was scanned)
+def scan_file(path: Path) -> tuple[list[list[str]], bool]:
+    book = path.name
+    with timings.timed('strip', book, bytes=path.stat().st_size):
+        body = gutenberg.read_body(path)
+    # Tokens and syllable counts come from the token cache when this text was
+    # tokenized before with the same tokenizer and table; otherwise they are
+    # collected while scanning and saved for next time.
+    token_file, key = TOKEN_DIR / f"{path.stem}.tok", token_cache_key(body)
+    cached = read_token_cache(token_file, key, body)
+    source = cached or ((words, None) for words in sentences(body))
+    haikus, arrays, complete = scan_sentences(book, body, source, None if cached else token_arrays(),
+                                              'token cache' if cached else TOKENIZER)
+    if arrays:
+        write_token_cache(token_file, key, arrays)
+    return haikus, complete
+
+
+# Shards: `text` is body[lo:hi] and the shard owns the sentences whose first
+# word starts in body[start:end]. The first sentence of a shard that begins
+# mid-book may be the tail of a longer one, so it is never owned; the shard
+# before owns it whole. Returns the haikus, the owned sentences' tokens at
+# their offsets in the body (None when the haiku budget cut the shard short),
+# and whether the text reached far enough both ways.
+def scan_shard(book: str, text: str, lo: int, start: int, end: int, at_end: bool):
+    started = time.perf_counter()
+    owned, first = [], []
+
+    def owns(arrays):
+        if arrays is None:
+            raise ValueError(f"{book}: a token was not found verbatim in the text")
+        bounds = arrays['bounds']
+        s = len(bounds) - 2
+        if bounds[s] == bounds[s + 1]:
+            return False  # no words
+        at = lo + arrays['starts'][bounds[s]]
+        if s == 0 and lo > 0:
+            first.append(at)
+            return False
+        if start <= at < end:
+            owned.append(s)
+            return True
+        return False
+
+    arrays = token_arrays()
+    source = ((words, None) for words in sentences(text))
+    # scan_sharded counts the finds of the shards it keeps
+    haikus, arrays, complete = scan_sentences(book, text, source, arrays, TOKENIZER, owns, count=False)
+    if not complete:
+        return haikus, None, True, job_report(book, started)
+    # the head is complete when the first sentence starts before this shard's
+    # own range; the tail when the last owned sentence is followed by another
+    head = lo == 0 or not first or first[0] < start
+    tail = at_end or not owned or owned[-1] < len(arrays['bounds']) - 2
+    out = token_arrays()
+    bounds = arrays['bounds']
+    for s in owned:
+        a, b = bounds[s], bounds[s + 1]
+        out['starts'].extend(lo + k for k in arrays['starts'][a:b])
+        out['lengths'].extend(arrays['lengths'][a:b])
+        out['counts'].extend(arrays['counts'][a:b])
+        out['bounds'].append(len(out['starts']))
+    return haikus, out, head and tail, job_report(book, started)
+
+# Process-pool workers load the syllable table once here rather than per
+# book; spaCy loads on first use, which a run served from the token cache
+# never reaches.
+_in_worker = False
+_workers_lock = threading.Lock()
+
+
+def init_worker(cache_size: int, found):
+    global _in_worker, _found
+    _in_worker = True
+    _found = found
+    timings.reset()  # forked workers would otherwise report the parent's numbers again
+    syllables.set_cache_size(cache_size)
+    syllables.table()
+
+
+def scan_job(path: Path):
+    started = time.perf_counter()
+    return scan_file(path), job_report(path.name, started)
+
+
+# Sent back with every job: the worker's pid, when the job ran (perf_counter
+# is system-wide, so the times compare across processes), the worker's
+# syllable cache counters and the book's timings
+def job_report(book: str, started: float):
+    return os.getpid(), started, time.perf_counter(), syllables.cache_stats(), timings.take(book)
+
+
+def record_job(workers: dict, book: str, report):
+    pid, started, ended, cache_stats, book_timings = report
+    timings.merge(book, book_timings)
+    with _workers_lock:
+        w = workers.setdefault(pid, {'jobs': 0, 'busy': 0.0, 'first': started, 'last': ended})
+        w['jobs'] += 1
+        w['busy'] += ended - started
+        w['first'] = min(w['first'], started)
+        w['last'] = max(w['last'], ended)
+        # results from one worker can arrive out of order; its counters only
+        # grow, so the snapshot with the most lookups is the latest
+        lookups = cache_stats['hits'] + cache_stats['misses']
+        if 'cache' not in w or lookups >= w['cache']['hits'] + w['cache']['misses']:
+            w['cache'] = cache_stats
+
+
+# Busy time of each scanner over the span from the first job to the last; the
+# span is the makespan of the scan, which a straggler drags out
+def utilization_report(workers: dict) -> str:
+    if not workers:
+        return "Scan workers: no books scanned"
+    span = max(w['last'] for w in workers.values()) - min(w['first'] for w in workers.values())
+    rows = [f"Scan workers: makespan {span:.2f}s"]
+    for n, (pid, w) in enumerate(sorted(workers.items()), 1):
+        util = 100 * w['busy'] / span if span else 100.0
+        rows.append(f"  worker {n} (pid {pid}): {w['jobs']} jobs, {w['busy']:.2f}s busy, {util:.0f}% utilized")
+    return "\n".join(rows)
+
+
+# Started before any pipeline thread, so the workers fork from a process
+# with nothing else running; None when books are scanned in this process
+def scan_pool() -> ProcessPoolExecutor | None:
+    if SCAN_WORKERS <= 1:
+        return None
+    pool = ProcessPoolExecutor(max_workers=SCAN_WORKERS, initializer=init_worker,
+                               initargs=(SYLLABLE_CACHE_SIZE, _found))
+    pool.submit(os.getpid).result()  # forks every worker now
+    return pool
+
+
+# A large book is cut at blank lines into shards for the pool workers to scan
+# at once; a shard that came back without whole sentences at its edges goes
+# again with twice the overlap. Merged in order, the shards give the haikus
+# and token cache of a serial scan; (haikus, complete) like scan_file. None
+# when the book is better scanned whole: its token cache is current, or a
+# token was not found in the text.
+def scan_sharded(path: Path, pool: ProcessPoolExecutor, workers: dict) -> tuple[list[list[str]], bool] | None:
+    book = path.name
+    with timings.timed('strip', book, bytes=path.stat().st_size):
+        body = gutenberg.read_body(path)
+    token_file, key = TOKEN_DIR / f"{path.stem}.tok", token_cache_key(body)
+    if token_cache_valid(token_file, key):
+        return None
+    cuts = [0, *chunk_ends(body, SHARD_CHARS)]
+    overlap = {shard: SHARD_OVERLAP for shard in zip(cuts, cuts[1:])}
+    done = {}
+    while (pending := [shard for shard in overlap if shard not in done]) and not budget_reached():
+        jobs = {}
+        for start, end in pending:
+            # widened to whole lines, like the cuts themselves
+            lo = body.rfind("\n", 0, max(0, start - overlap[start, end])) + 1
+            hi = body.find("\n", min(len(body), end + overlap[start, end]))
+            hi = len(body) if hi == -1 else hi
+            jobs[start, end] = pool.submit(scan_shard, book, body[lo:hi], lo, start, end, hi == len(body))
+        try:
+            for shard, job in jobs.items():
+                haikus, arrays, complete, report = job.result()
+                record_job(workers, book, report)
+                if complete:
+                    done[shard] = haikus, arrays
+                    count_found(len(haikus))
+                else:
+                    overlap[shard] *= 2
+        except ValueError:
+            # the book is scanned again whole, which counts its finds anew
+            for job in jobs.values():
+                job.cancel()
+            count_found(-sum(len(haikus) for haikus, _ in done.values()))
+            return None
+
+    # shards cut short by the haiku budget have no tokens, nor do the ones
+    # never scanned, so neither leaves a token cache
+    complete = len(done) == len(overlap) and all(arrays for _, arrays in done.values())
+    found, merged = {}, token_arrays()
+    for shard in sorted(done):
+        haikus, arrays = done[shard]
+        for h in haikus:
+            found.setdefault(tuple(h))
+        if complete:
+            base = len(merged['starts'])
+            for name in ('starts', 'lengths', 'counts'):
+                merged[name].extend(arrays[name])
+            merged['bounds'].extend(base + k for k in arrays['bounds'][1:])
+    if complete:
+        write_token_cache(token_file, key, merged)
+    return [list(h) for h in found], complete
+
+# Results cache: haikus per book keyed by the cleaned text and the detector
+# settings, so unchanged books are never scanned twice
+# Read from package metadata so fingerprinting never has to import spaCy
+def package_version(name: str) -> str:
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return 'missing'
+
+
+def tokenizer_fingerprint() -> str:
+    if TOKENIZER == 'spacy':
+        return f"spacy-{package_version('spacy')}/{SPACY_MODEL}-{package_version(SPACY_MODEL)}"
+    if TOKENIZER == 'regex':
+        return f"regex-{tokenizer_backends.regex_fingerprint()}"
+    return f"{TOKENIZER}-{package_version('nltk')}"
+
+
+def settings_fingerprint() -> str:
+    settings = {
+        'forms': form_sizes(),
+        'filters': FILTER_VERSION,
+        'tokenizer': tokenizer_fingerprint(),
+        'syllables': syllables.table_fingerprint(),
+    }
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def book_key(path: Path, fingerprint: str) -> str:
+    # hashes the body straight from the memory map, without decoding it
+    with gutenberg.mapped_body(path) as body:
+        return f"{hashlib.sha256(body).hexdigest()}-{fingerprint}"
+
+
+def load_results_cache(fingerprint: str) -> dict[str, list[list[str]]]:
+    try:
+        cache = json.loads(RESULTS_CACHE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    # entries made with other settings can never match again
+    return {k: v for k, v in cache.items() if k.endswith(f"-{fingerprint}")}
+
+
+def save_results_cache(cache: dict[str, list[list[str]]]):
+    tmp = RESULTS_CACHE.with_suffix('.tmp')
+    tmp.write_text(json.dumps(cache), encoding='utf-8')
+    tmp.replace(RESULTS_CACHE)
+
+# Pipeline: each stage is a few threads that take a book from one queue,
+# call the stage function and put its result on the next queue, or drop the
+# book when the function returns None. DONE closes a queue; it sorts after
+# every book, so it also closes a priority queue.
+DONE = (float('inf'),)
+
+
+def pipeline_stage(fn, inbox: queue.Queue, workers: int, errors: list, outbox: queue.Queue | None = None) -> queue.Queue:
+    if outbox is None:
+        outbox = queue.Queue(maxsize=PIPELINE_QUEUE)
+
+    def work():
+        while (item := inbox.get()) is not DONE:
+            try:
+                out = fn(item)
+            except Exception as e:  # re-raised by main once the pipeline drains
+                errors.append(e)
+                continue
+            if out is not None:
+                outbox.put(out)
+        inbox.put(DONE)  # so the other workers of this stage stop too
+
+    threads = [threading.Thread(target=work, daemon=True) for _ in range(max(1, workers))]
+    for t in threads:
+        t.start()
+
+    def close():
+        for t in threads:
+            t.join()
+        outbox.put(DONE)
+
+    threading.Thread(target=close, daemon=True).start()
+    return outbox
+
+
+def drain(q: queue.Queue):
+    while (item := q.get()) is not DONE:
+        yield item
+
+
+# First stage: downloads as they land, then the texts already in TEXT_DIR that
+# this run did not download, up to MAX_BOOKS books in all. A book's rank
+# orders the zine: top-list position first, then file name.
+def feed_books(books: queue.Queue, errors: list):
+    sent = set()
+
+    def send(rank, path: Path):
+        if path.name not in sent and len(sent) < MAX_BOOKS and not budget_reached():
+            sent.add(path.name)
+            books.put((rank, path))
+
+    try:
+        fetch_top_texts(send)
+        for path in sorted(TEXT_DIR.glob('*.txt')):
+            send((1, path.name), path)
+    except Exception as e:
+        errors.append(e)
+    finally:
+        books.put(DONE)
+
+
+# non-English texts never reach the scanners
+def check_language(item):
+    rank, path = item
+    return item if is_english(path) else None
+
+
+# Keys come first in the tuple, so the scan queue hands out books in this order
+def cache_key(item, fingerprint: str, cache: dict):
+    rank, path = item
+    with timings.timed('cache key', path.name, bytes=path.stat().st_size):
+        key = book_key(path, fingerprint)
+    return scan_order(path, key, cache), rank, path, key
+
+
+# Results-cache hits take no time and go first; then the largest books
+def scan_order(path: Path, key: str, cache: dict) -> float:
+    return float('-inf') if key in cache else -scan_cost(path)
+
+
+def scan_cost(path: Path) -> int:
+    try:
+        with (TOKEN_DIR / f"{path.stem}.tok").open('rb') as f:
+            magic, _, tokens, _ = TOKEN_HEADER.unpack(f.read(TOKEN_HEADER.size))
+        if magic == TOKEN_MAGIC:
+            return tokens
+    except (OSError, struct.error):
+        pass
+    return path.stat().st_size // BYTES_PER_TOKEN
+
+
+# Books in the results cache skip the scanners; the rest are scanned in a
+# pool worker, large ones in shards that every idle worker picks up, or in
+# this thread when there is no pool. Once the haiku budget is met the books
+# still queued are dropped, and a book cut short goes on without its key,
+# so its partial haikus are never cached.
+def scan_book(item, cache: dict, pool: ProcessPoolExecutor | None, workers: dict):
+    _, rank, path, key = item
+    if budget_reached():
+        return None
+    if key in cache:
+        count_found(len(cache[key]))
+        return rank, path, key, cache[key], False
+    result = None
+    if pool and path.stat().st_size > 2 * SHARD_CHARS:
+        result = scan_sharded(path, pool, workers)
+    if result is None:
+        result, report = pool.submit(scan_job, path).result() if pool else scan_job(path)
+        record_job(workers, path.name, report)
+    haikus, complete = result
+    return rank, path, key if complete else None, haikus, True
+
+
+# a book cut short by the haiku budget has no key; its partial haikus must
+# not replace the complete file of an earlier run
+def write_book(item):
+    rank, path, key, haikus, scanned = item
+    if haikus and key:
+        with timings.timed('write', path.name) as c, (RESULT_DIR / path.name).open('w', encoding='utf-8') as ob:
+            for h in haikus:
+                c['bytes'] = c.get('bytes', 0) + ob.write("\n".join(h)+"\n\n")
+    return item
 
 # Main
 def main():
-    fetch_top_texts()
-    files = list(TEXT_DIR.glob('*.txt'))[:MAX_BOOKS]
-    print(f'⚙️ Scanning {len(files)} text files for haikus…')
-    total, zine = 0, ['# Accidental Haikus\n']
-    for fpath in files:
-        haikus = scan_file(fpath)
+    global _found
+    ready = time.perf_counter()
+    timings.reset()
+    syllables.set_cache_size(SYLLABLE_CACHE_SIZE)
+    load_manifest()
+    fingerprint = settings_fingerprint()
+    cache = load_results_cache(fingerprint)
+    workers, errors, done = {}, [], {}
+    _found = multiprocessing.Value('q', 0)  # before the pool, which shares it
+    pool = scan_pool()
+    try:
+        books = queue.Queue(maxsize=PIPELINE_QUEUE)
+        threading.Thread(target=feed_books, args=(books, errors), daemon=True).start()
+        english = pipeline_stage(check_language, books, LANGUAGE_WORKERS, errors)
+        # unbounded, so books queue up for the scanners and the costliest go first
+        keyed = pipeline_stage(functools.partial(cache_key, fingerprint=fingerprint, cache=cache), english,
+                               KEY_WORKERS, errors, queue.PriorityQueue())
+        scanned = pipeline_stage(functools.partial(scan_book, cache=cache, pool=pool, workers=workers),
+                                 keyed, SCAN_WORKERS, errors)
+        written = pipeline_stage(write_book, scanned, WRITE_WORKERS, errors)
+        for rank, fpath, key, haikus, fresh in tqdm(drain(written), desc='Books', leave=False):
+            if key:
+                cache[key] = haikus
+            done[rank] = (fpath, haikus, fresh)
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+    # saved before any error is raised, so the books that did finish are
+    # neither downloaded nor scanned again next run
+    save_manifest()
+    save_results_cache(cache)
+    if errors:
+        raise errors[0]
+    total, sources, zine = 0, 0, ['# Accidental Haikus\n']
+    for rank in sorted(done):
+        fpath, haikus, _ = done[rank]
+        if TARGET_HAIKU_COUNT:
+            haikus = haikus[:TARGET_HAIKU_COUNT - total]
         if not haikus:
             continue
         author, title = fpath.stem.split(' - ',1)
-        out_book = RESULT_DIR / fpath.name
-        with out_book.open('w', encoding='utf-8') as ob:
-            for h in haikus:
-                ob.write("\n".join(h)+"\n\n")
         zine.append(f"## {author} – {title}\n")
         for h in haikus:
             zine.append("\n".join(h)+"\n")
         zine.append("\n")
-        total += 1
-        if total >= TARGET_HAIKU_COUNT:
-            break
-    ZINE_FILE.write_text(''.join(zine), encoding='utf-8')
-    print(f"\nScan complete. {total} sources processed.")
+        total += len(haikus)
+        sources += 1
+    with timings.timed('write') as c:
+        c['bytes'] = ZINE_FILE.write_text(''.join(zine), encoding='utf-8')
+    fresh = sum(f for _, _, f in done.values())
+    print(f"⚙️ Scanned {fresh} text files for haikus ({len(done) - fresh} unchanged, from cache)")
+    print(f"\nScan complete. {total} haikus from {sources} sources.")
+    print(syllables.cache_report(syllables.combine_stats(w['cache'] for w in workers.values())))
+    print(utilization_report(workers))
+    print(timings.report(TIMINGS_FILE))
+    print(resources.startup_report(ready))
 
 if __name__ == '__main__':
     main()
@@ -1,29 +1,25 @@
-import requests, re, nltk
+import requests, re, sys
+from pathlib import Path
 from bs4 import BeautifulSoup
-from nltk.corpus import cmudict
 from nltk.tokenize import word_tokenize, sent_tokenize
 from nltk import pos_tag
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
-nltk.download('cmudict')
-nltk.download('punkt')
-nltk.download('averaged_perceptron_tagger')
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import gutenberg
+import syllables
+from resources import ensure_nltk
+
+ensure_nltk('punkt')
+ensure_nltk('averaged_perceptron_tagger')
 
-d = cmudict.dict()
 analyzer = SentimentIntensityAnalyzer()
 
 def clean_gutenberg_text(text):
-    start_pattern = r"\*\*\* START OF (THE|THIS) PROJECT GUTENBERG EBOOK .* \*\*\*"
-    end_pattern = r"\*\*\* END OF (THE|THIS) PROJECT GUTENBERG EBOOK .* \*\*\*"
-    start_match = re.search(start_pattern, text, re.IGNORECASE)
-    end_match = re.search(end_pattern, text, re.IGNORECASE)
-    return text[start_match.end():end_match.start()].strip() if start_match and end_match else text.strip()
+    return gutenberg.strip(text).strip()
 
 def count_syllables(word):
-    word = word.lower()
-    if word in d:
-        return min(len([y for y in pronunciation if y[-1].isdigit()]) for pronunciation in d[word])
-    return max(1, len(re.findall(r'[aeiouy]+', word)))
+    return syllables.count_syllables(word, minimum=1)
 
 def is_sentence_like(line):
     tagged = pos_tag(word_tokenize(line))
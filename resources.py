@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+resources.py
+
+Lazy loading helpers for the heavy NLP resources.
+- ensure_nltk() looks in the local nltk_data first and only downloads when missing
+- loading() times a resource the first time it is created
+- startup_report() summarises start-up time and those load times
+"""
+
+import time
+from contextlib import contextmanager
+
+# Imported first by the entry points, so this is close to process start
+START = time.perf_counter()
+
+NLTK_PATHS = {
+    "cmudict": "corpora/cmudict",
+    "punkt": "tokenizers/punkt",
+    "punkt_tab": "tokenizers/punkt_tab",
+    "averaged_perceptron_tagger": "taggers/averaged_perceptron_tagger",
+}
+
+load_times: dict[str, float] = {}
+
+
+def ensure_nltk(package: str) -> None:
+    import nltk
+
+    try:
+        nltk.data.find(NLTK_PATHS.get(package, package))
+    except LookupError:
+        with loading(f"nltk {package} download"):
+            nltk.download(package, quiet=True)
+
+
+@contextmanager
+def loading(name: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        load_times[name] = load_times.get(name, 0.0) + time.perf_counter() - start
+
+
+def startup_report(ready_at: float) -> str:
+    parts = [f"Startup: ready in {ready_at - START:.2f}s"]
+    parts += [f"{name} loaded in {secs:.2f}s on first use" for name, secs in load_times.items()]
+    return "; ".join(parts)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+syllables.py
+
+Shared syllable lookup for every haiku detector in this repo.
+- `python syllables.py` collapses cmudict.dict() into cmudict_syllables.bin
+- The table keeps each word's minimum syllable count as one uint8
+- Lookups bisect the sorted words inside one read-only mmap, never a dict, so
+  every pool worker shares the same pages and attaches in milliseconds
+- Lookups go through a bounded LRU cache that keeps hit/miss/OOV counters
+"""
+
+import functools
+import hashlib
+import mmap
+import os
+import re
+import struct
+import threading
+from array import array
+from pathlib import Path
+
+TABLE_FILE = Path(__file__).resolve().parent / "cmudict_syllables.bin"
+
+# Layout: magic, word count, then uint32 word offsets (count + 1 of them),
+# uint8 syllable counts and finally the sorted, utf-8 encoded words.
+MAGIC = b"HKSYL001"
+HEADER = struct.Struct("<8sI")
+
+# Distinct words kept in the lookup cache; change it with set_cache_size()
+CACHE_SIZE = 100_000
+
+_table = None
+_oov = 0
+_lock = threading.RLock()
+
+
+def build_table(path: Path = TABLE_FILE) -> Path:
+    from nltk.corpus import cmudict
+    from resources import ensure_nltk
+
+    ensure_nltk("cmudict")
+    counts = {
+        word.encode("utf-8"): min(len([ph for ph in pron if ph[-1].isdigit()]) for pron in prons)
+        for word, prons in cmudict.dict().items()
+    }
+    keys = sorted(counts)
+    offsets, pos = array("I", [0]), 0
+    for key in keys:
+        pos += len(key)
+        offsets.append(pos)
+    syllables = bytes(min(counts[key], 255) for key in keys)
+
+    # unique per process and thread, so concurrent builds never share a file
+    tmp = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    with tmp.open("wb") as f:
+        f.write(HEADER.pack(MAGIC, len(keys)))
+        f.write(offsets.tobytes())
+        f.write(syllables)
+        f.write(b"".join(keys))
+    tmp.replace(path)
+    return path
+
+
+# Builds the table on first use; the lock keeps threads from building it at once
+def ensure_table(path: Path = TABLE_FILE) -> Path:
+    with _lock:
+        if not path.exists():
+            build_table(path)
+    return path
+
+
+# (map, word count, offsets view, start of the counts, start of the words).
+# The map is read-only, so all processes share its pages in the page cache.
+def open_table(path: Path = TABLE_FILE):
+    ensure_table(path)
+    with path.open("rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, n = HEADER.unpack_from(mm)
+    if magic != MAGIC:
+        mm.close()
+        raise ValueError(f"{path} is not a syllable table")
+    offsets = memoryview(mm)[HEADER.size:HEADER.size + 4 * (n + 1)].cast("I")
+    counts = HEADER.size + 4 * (n + 1)
+    return mm, n, offsets, counts, counts + n
+
+
+# Changes whenever the table file is rebuilt, for keying caches of results
+def table_fingerprint(path: Path = TABLE_FILE) -> str:
+    ensure_table(path)
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+
+
+def table():
+    global _table
+    if _table is None:
+        with _lock:
+            if _table is None:
+                _table = open_table()
+    return _table
+
+
+# Binary search over the sorted words; misses are few thanks to the LRU cache
+def lookup(word: str) -> int | None:
+    mm, n, offsets, counts, words = table()
+    key = word.lower().encode("utf-8")
+    lo, hi = 0, n
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if mm[words + offsets[mid]:words + offsets[mid + 1]] < key:
+            lo = mid + 1
+        else:
+            hi = mid
+    if lo < n and mm[words + offsets[lo]:words + offsets[lo + 1]] == key:
+        return mm[counts + lo]
+    return None
+
+
+# (count, in_table) for one word; only runs on a cache miss
+def _resolve(word: str) -> tuple[int, bool]:
+    global _oov
+    n = lookup(word)
+    if n is not None:
+        return n, True
+    _oov += 1
+    return len(re.findall(r"[aeiouy]+", word.lower())), False
+
+
+_cached = functools.lru_cache(maxsize=CACHE_SIZE)(_resolve)
+
+
+def set_cache_size(size: int) -> None:
+    global _cached, _oov
+    _cached = functools.lru_cache(maxsize=size)(_resolve)
+    _oov = 0
+
+
+def count_syllables(word: str, minimum: int = 0) -> int:
+    n, known = _cached(word)
+    return n if known else max(minimum, n)
+
+
+def cache_stats() -> dict[str, int]:
+    info = _cached.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "oov": _oov,
+        "entries": info.currsize,
+        "max_entries": info.maxsize,
+    }
+
+
+# Sums the stats of several processes, e.g. one snapshot per pool worker
+def combine_stats(stats) -> dict[str, int]:
+    total = dict.fromkeys(("hits", "misses", "oov", "entries", "max_entries"), 0)
+    for st in stats:
+        for key in total:
+            total[key] += st[key]
+    return total
+
+
+def cache_report(stats: dict[str, int] | None = None) -> str:
+    st = stats or cache_stats()
+    lookups = st["hits"] + st["misses"]
+    rate = 100 * st["hits"] / lookups if lookups else 0.0
+    return (f"Syllable cache: {st['hits']:,} hits, {st['misses']:,} misses ({rate:.1f}% hit rate), "
+            f"{st['oov']:,} OOV words, {st['entries']:,}/{st['max_entries']:,} entries")
+
+
+if __name__ == "__main__":
+    out = build_table()
+    print(f"✔ Syllable table written to {out}")
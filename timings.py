@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+timings.py
+
+Per-stage, per-book instrumentation for the haiku pipeline.
+- `with timed("spacy", book) as c:` records wall time and CPU time for a stage
+- Extra counters (bytes, tokens, candidates, ...) are added through `c`
+- Worker processes hand their numbers back with take()/merge()
+- report() writes a JSON file and returns a summary table
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+_lock = threading.Lock()
+_books: dict[str, dict[str, dict[str, float]]] = {}
+
+
+def reset():
+    with _lock:
+        _books.clear()
+
+
+def add(stage: str, book: str = "", **counts):
+    with _lock:
+        entry = _books.setdefault(book, {}).setdefault(stage, {"calls": 0})
+        entry["calls"] += 1
+        for key, value in counts.items():
+            entry[key] = entry.get(key, 0) + value
+
+
+# CPU time is per thread, so download threads are not charged for each other
+@contextmanager
+def timed(stage: str, book: str = "", **counts):
+    wall, cpu = time.perf_counter(), time.thread_time()
+    try:
+        yield counts
+    finally:
+        add(stage, book, wall=time.perf_counter() - wall, cpu=time.thread_time() - cpu, **counts)
+
+
+# Removes and returns one book's stages, e.g. to send back from a worker
+def take(book: str) -> dict[str, dict[str, float]]:
+    with _lock:
+        return _books.pop(book, {})
+
+
+def merge(book: str, stages: dict[str, dict[str, float]]):
+    with _lock:
+        target = _books.setdefault(book, {})
+        for stage, values in stages.items():
+            entry = target.setdefault(stage, {})
+            for key, value in values.items():
+                entry[key] = entry.get(key, 0) + value
+
+
+def rename(old: str, new: str):
+    merge(new, take(old))
+
+
+def totals() -> dict[str, dict[str, float]]:
+    out: dict[str, dict[str, float]] = {}
+    with _lock:
+        for stages in _books.values():
+            for stage, values in stages.items():
+                entry = out.setdefault(stage, {})
+                for key, value in values.items():
+                    entry[key] = entry.get(key, 0) + value
+    return out
+
+
+def report(path: Path) -> str:
+    stages = totals()
+    with _lock:
+        books = {book: dict(s) for book, s in _books.items()}
+    path.write_text(json.dumps({"stages": stages, "books": books}, indent=2), encoding="utf-8")
+
+    rows = [f"{'stage':<12}{'calls':>8}{'wall s':>10}{'cpu s':>10}{'MB':>10}{'tokens':>12}{'cand.':>12}{'tok/s':>12}"]
+    for stage, v in stages.items():
+        wall = v.get("wall", 0.0)
+        tokens = v.get("tokens", 0)
+        rate = f"{tokens / wall:,.0f}" if tokens and wall else "-"
+        rows.append(
+            f"{stage:<12}{int(v.get('calls', 0)):>8}{wall:>10.2f}{v.get('cpu', 0.0):>10.2f}"
+            f"{v.get('bytes', 0) / 1e6:>10.1f}{int(tokens):>12,}{int(v.get('candidates', 0)):>12,}{rate:>12}"
+        )
+    return "\n".join(rows)
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+tokenizer_backends.py
+
+Tokenizer backends for the haiku detectors.
+- Every sentence backend takes the text and yields the alphabetic words of each sentence
+- regex: two compiled patterns and no model to load, by far the fastest
+- nltk: punkt sentences and Treebank words, like the v1/v2 scripts
+- hkdt_v3 adds its streaming spaCy backend on top of these
+- regex_words() alone stands in for word_tokenize in the v2 scripts
+"""
+
+import hashlib
+import re
+
+# Alphabetic words, split the way spaCy and NLTK split them: clitics such as
+# n't and 's and titles such as "Mr." are matched as well, but only the words
+# in the group are kept ("don't" -> "do", "Mr." and "J." -> nothing).
+WORD_RE = re.compile(
+    r"(?:\b(?:Mrs|Mr|Ms|Dr|St|[A-Za-z])\.|n['’]t\b|['’](?:s|m|d|ll|re|ve)\b)"
+    r"|([^\W\d_]+(?![^\W\d_]|['’])|[^\W\d_]+?(?=n['’]t\b)|[^\W\d_]+)"
+)
+
+# A sentence ends after ! or ?, or after a full stop that is not part of a
+# title, an initial or an ellipsis, once any closing quotes or brackets and
+# then whitespace follow
+SENTENCE_END_RE = re.compile(
+    r"(?:[!?]"
+    r"|\.(?<!\bMr\.)(?<!\bMrs\.)(?<!\bMs\.)(?<!\bDr\.)(?<!\bSt\.)"
+    r"(?<![\s(\"“‘][A-Za-z]\.)(?<!^[A-Za-z]\.)(?<!\.\.)(?!\.\.))"
+    r"[.!?]*[\"'”’)\]]*(?=\s|\Z)"
+)
+
+
+def regex_words(text: str, start: int = 0, end: int | None = None) -> list[str]:
+    return [w for w in WORD_RE.findall(text, start, len(text) if end is None else end) if w]
+
+
+def regex_sentences(text: str):
+    start = 0
+    for m in SENTENCE_END_RE.finditer(text):
+        yield regex_words(text, start, m.end())
+        start = m.end()
+    if start < len(text):
+        yield regex_words(text, start)
+
+
+def nltk_sentences(text: str):
+    from nltk.tokenize import sent_tokenize, word_tokenize
+    from resources import ensure_nltk
+
+    ensure_nltk("punkt")
+    for sent in sent_tokenize(text):
+        yield [w for w in word_tokenize(sent) if w.isalpha()]
+
+
+SENTENCE_BACKENDS = {"regex": regex_sentences, "nltk": nltk_sentences}
+
+
+# Changes whenever the regex backend would split text differently
+def regex_fingerprint() -> str:
+    patterns = WORD_RE.pattern + SENTENCE_END_RE.pattern
+    return hashlib.sha256(patterns.encode("utf-8")).hexdigest()[:16]
@@ -1,25 +1,18 @@
 #!/usr/bin/env python3
 import os
-import re
+import sys
 import argparse
 from pathlib import Path
 from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.corpus import cmudict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
-import nltk
 
-nltk.download('punkt')
-nltk.download('cmudict')
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import gutenberg
+from resources import ensure_nltk
+from syllables import count_syllables
 
-cmu_dict = cmudict.dict()
-
-# Syllable count using CMUdict or fallback
-def count_syllables(word):
-    word = word.lower()
-    if word in cmu_dict:
-        return min(len([ph for ph in pron if ph[-1].isdigit()]) for pron in cmu_dict[word])
-    return len(re.findall(r"[aeiouy]+", word))
+ensure_nltk('punkt')
 
 # Total syllables in a line
 def line_syllable_count(line):
@@ -32,17 +25,12 @@ def is_haiku(trio, pattern):
 
 # Remove Gutenberg boilerplate
 def clean_gutenberg_text(text):
-    start = re.search(r"\*\*\* START OF .*? \*\*\*", text)
-    end = re.search(r"\*\*\* END OF .*? \*\*\*", text)
-    if start and end:
-        return text[start.end():end.start()].strip()
-    return text
+    return gutenberg.strip(text).strip()
 
 # Scan one file for haikus
 def scan_file_for_haikus(path, form):
     pattern = [int(x) for x in form.split("-")]
-    with open(path, encoding='utf-8') as f:
-        text = clean_gutenberg_text(f.read())
+    text = gutenberg.read_body(path).strip()
     sents = sent_tokenize(text)
     return [sents[i:i+3] for i in range(len(sents)-2) if is_haiku(sents[i:i+3], pattern)]
 
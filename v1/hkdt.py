@@ -7,27 +7,21 @@ detects 5-7-5 or 3-5-3 haikus using NLTK, and outputs results
 in Markdown format to /Users/tmbp/haiku_detector/results/haiku_zine.md
 """
 
-import re
+import sys
 import argparse
 import requests
 from pathlib import Path
 from bs4 import BeautifulSoup
 from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.corpus import cmudict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
-import nltk
 
-nltk.download('punkt')
-nltk.download('cmudict')
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import gutenberg
+from resources import ensure_nltk
+from syllables import count_syllables
 
-cmu_dict = cmudict.dict()
-
-def count_syllables(word):
-    word = word.lower()
-    if word in cmu_dict:
-        return min(len([ph for ph in pron if ph[-1].isdigit()]) for pron in cmu_dict[word])
-    return len(re.findall(r"[aeiouy]+", word))
+ensure_nltk('punkt')
 
 def line_syllable_count(line):
     words = word_tokenize(line)
@@ -37,11 +31,7 @@ def is_haiku(trio, pattern):
     return all(line_syllable_count(line) == count for line, count in zip(trio, pattern))
 
 def clean_gutenberg_text(text):
-    start = re.search(r"\*\*\* START OF .*? \*\*\*", text)
-    end = re.search(r"\*\*\* END OF .*? \*\*\*", text)
-    if start and end:
-        return text[start.end():end.start()].strip()
-    return text
+    return gutenberg.strip(text).strip()
 
 def try_download(eid, destination):
     urls = [
@@ -71,8 +61,7 @@ def fetch_top_100(text_dir):
 
 def scan_file_for_haikus(path, form):
     pattern = [int(n) for n in form.split("-")]
-    with open(path, encoding="utf-8", errors="ignore") as f:
-        text = clean_gutenberg_text(f.read())
+    text = gutenberg.read_body(path).strip()
     sents = sent_tokenize(text)
     return [sents[i:i+3] for i in range(len(sents)-2) if is_haiku(sents[i:i+3], pattern)]
 
@@ -9,26 +9,22 @@ Haiku Detector – Final Project (Revised)
 """
 
 import re
+import sys
 import argparse
 import requests
 from pathlib import Path
 from bs4 import BeautifulSoup
 from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.corpus import cmudict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
-import nltk
 
-nltk.download("punkt")
-nltk.download("cmudict")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import catalog
+import gutenberg
+from resources import ensure_nltk
+from syllables import count_syllables
 
-cmu_dict = cmudict.dict()
-
-def count_syllables(word):
-    word = word.lower()
-    if word in cmu_dict:
-        return min(len([ph for ph in pron if ph[-1].isdigit()]) for pron in cmu_dict[word])
-    return len(re.findall(r"[aeiouy]+", word))
+ensure_nltk("punkt")
 
 def line_syllable_count(line):
     words = word_tokenize(line)
@@ -42,23 +38,12 @@ def is_haiku(trio, pattern):
     return all(line_syllable_count(line) == target for line, target in zip(trio, pattern))
 
 def clean_gutenberg_text(text):
-    start = re.search(r"\*\*\* START OF .*? \*\*\*", text)
-    end = re.search(r"\*\*\* END OF .*? \*\*\*", text)
-    if start and end:
-        return text[start.end():end.start()].strip()
-    return text
+    return gutenberg.strip(text).strip()
 
 def get_metadata(book_id):
-    url = f"https://www.gutenberg.org/ebooks/{book_id}"
-    html = requests.get(url).text
-    soup = BeautifulSoup(html, "html.parser")
-    try:
-        title = soup.select_one("h1").get_text(strip=True)
-        author_tag = soup.select_one("h2")
-        author = author_tag.get_text(strip=True) if author_tag else "Unknown"
-    except:
-        title = book_id
-        author = "Unknown"
+    meta = catalog.metadata(book_id)
+    title = meta["title"] if meta else book_id
+    author = (meta["author"] if meta else "") or "Unknown"
     filename = f"{author} - {title}".replace(":", "").replace("/", "-").replace("\\", "-").strip()
     return filename
 
@@ -95,8 +80,7 @@ def fetch_top_100(text_dir):
 
 def scan_file_for_haikus(path, form):
     pattern = [int(n) for n in form.split("-")]
-    with open(path, encoding="utf-8", errors="ignore") as f:
-        text = clean_gutenberg_text(f.read())
+    text = gutenberg.read_body(path).strip()
     sents = sent_tokenize(text)
     return [sents[i:i+3] for i in range(len(sents)-2) if is_haiku(sents[i:i+3], pattern)]
 
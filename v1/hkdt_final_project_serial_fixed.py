@@ -10,6 +10,7 @@ Haiku Detector – Final Project (Robust Version)
 """
 
 import re
+import sys
 import argparse
 import requests
 from langdetect import detect
@@ -18,67 +19,47 @@ DetectorFactory.seed = 0  # Ensures consistent detection and prevents race condi
 from pathlib import Path
 from bs4 import BeautifulSoup
 from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.corpus import cmudict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
-import nltk
 
-nltk.download("punkt")
-nltk.download("cmudict")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import catalog
+import gutenberg
+from resources import ensure_nltk
+from syllables import count_syllables
 
-cmu_dict = cmudict.dict()
-
-def count_syllables(word):
-    word = word.lower()
-    if word in cmu_dict:
-        return min(len([ph for ph in pron if ph[-1].isdigit()]) for pron in cmu_dict[word])
-    return len(re.findall(r"[aeiouy]+", word))
+ensure_nltk("punkt")
 
 def line_syllable_count(line):
     words = word_tokenize(line)
     return sum(count_syllables(w) for w in words if w.isalpha())
 
-def is_clean_haiku(trio, pattern):
-    if len(trio) != 3:
-        return False
-    if any(len(word_tokenize(line)) < 2 for line in trio):
-        return False
-    if any(re.match(r"^[A-Z]\.$", w.strip()) for line in trio for w in line.split()):
+def is_clean_sentence(sent):
+    if len(word_tokenize(sent)) < 2:
         return False
-    return all(line_syllable_count(line) == target for line, target in zip(trio, pattern))
+    return not any(re.match(r"^[A-Z]\.$", w.strip()) for w in sent.split())
 
 def detect_haikus(text, patterns):
     sents = sent_tokenize(text)
+    # each sentence is tokenized once, then trios are read from these arrays
+    clean = [is_clean_sentence(s) for s in sents]
+    counts = [line_syllable_count(s) if ok else None for s, ok in zip(sents, clean)]
     haikus = []
     for i in range(len(sents) - 2):
-        trio = sents[i:i+3]
+        if not (clean[i] and clean[i+1] and clean[i+2]):
+            continue
         for pattern in patterns:
-            if is_clean_haiku(trio, pattern):
-                haikus.append(trio)
-    return [
-        trio for i in range(len(sents)-2)
-        for pattern in patterns
-        if is_clean_haiku(sents[i:i+3], pattern)
-    ]
+            if counts[i] == pattern[0] and counts[i+1] == pattern[1] and counts[i+2] == pattern[2]:
+                haikus.append(sents[i:i+3])
+    return haikus
 
 def clean_gutenberg_text(text):
-    start = re.search(r"\*\*\* START OF .*? \*\*\*", text)
-    end = re.search(r"\*\*\* END OF .*? \*\*\*", text)
-    if start and end:
-        return text[start.end():end.start()].strip()
-    return text
+    return gutenberg.strip(text).strip()
 
 def get_metadata(book_id):
-    url = f"https://www.gutenberg.org/ebooks/{book_id}"
-    r = requests.get(url, timeout=10)
-    soup = BeautifulSoup(r.text, "html.parser")
-    try:
-        title = soup.select_one("meta[name='title']") or soup.select_one("h1")
-        title = title["content"] if title.name == "meta" else title.get_text(strip=True)
-        author_tag = soup.select_one("meta[name='author']") or soup.select_one("h2")
-        author = author_tag["content"] if author_tag and author_tag.name == "meta" else author_tag.get_text(strip=True)
-    except:
-        title, author = book_id, "Unknown"
+    meta = catalog.metadata(book_id)
+    title = meta["title"] if meta else book_id
+    author = (meta["author"] if meta else "") or "Unknown"
     filename = f"{author} - {title}".replace(":", "").replace("/", "-").replace("\\", "-").strip()
     return filename
 
@@ -122,9 +103,7 @@ def fetch_top_100(text_dir):
     return downloaded
 
 def scan_file_for_haikus(path):
-    with open(path, encoding="utf-8", errors="ignore") as f:
-        raw = f.read()
-    clean = clean_gutenberg_text(raw)
+    clean = gutenberg.read_body(path).strip()
     return detect_haikus(clean, patterns=[[5, 7, 5], [3, 5, 3]])
 
 def save_haikus_md(results, output_file):
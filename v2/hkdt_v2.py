@@ -10,7 +10,7 @@ hkdt_v2.py — Accidental Haiku Extractor
 - Optionally writes JSON debug logs
 """
 
-import re
+import sys
 import argparse
 import requests
 import json
@@ -18,21 +18,16 @@ from langdetect import detect, DetectorFactory
 from pathlib import Path
 from bs4 import BeautifulSoup
 from nltk.tokenize import word_tokenize
-from nltk.corpus import cmudict
 from tqdm import tqdm
-import nltk
 
-DetectorFactory.seed = 0
-nltk.download("punkt")
-nltk.download("cmudict")
-
-cmu_dict = cmudict.dict()
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import catalog
+import gutenberg
+from resources import ensure_nltk
+from syllables import count_syllables
 
-def count_syllables(word):
-    word = word.lower()
-    if word in cmu_dict:
-        return min(len([ph for ph in pron if ph[-1].isdigit()]) for pron in cmu_dict[word])
-    return len(re.findall(r"[aeiouy]+", word))
+DetectorFactory.seed = 0
+ensure_nltk("punkt")
 
 def line_syllable_count(line):
     return sum(count_syllables(w) for w in word_tokenize(line) if w.isalpha())
@@ -43,21 +38,14 @@ def is_haiku(lines, pattern):
     return all(line_syllable_count(line) == count for line, count in zip(lines, pattern))
 
 def get_metadata(book_id):
-    url = f"https://www.gutenberg.org/ebooks/{book_id}"
-    r = requests.get(url, timeout=10)
-    soup = BeautifulSoup(r.text, "html.parser")
-    try:
-        title = soup.select_one("meta[name='title']").get("content", "").strip()
-        author = soup.select_one("meta[name='author']").get("content", "").strip()
-    except:
-        title, author = str(book_id), "Unknown"
+    meta = catalog.metadata(book_id)
+    title = meta["title"] if meta else str(book_id)
+    author = (meta["author"] if meta else "") or "Unknown"
     filename = f"{author} - {title}".replace("/", "-").replace(":", "").strip()
     return filename or str(book_id)
 
 def clean_text(text):
-    start = re.search(r"\*\*\* START OF .*? \*\*\*", text)
-    end = re.search(r"\*\*\* END OF .*? \*\*\*", text)
-    return text[start.end():end.start()].strip() if start and end else text
+    return gutenberg.strip(text).strip()
 
 def download_and_clean(book_id, destination):
     urls = [
@@ -94,8 +82,7 @@ def fetch_english_texts(target_dir, required_count=100, top_n=200):
     return downloaded
 
 def extract_haikus_from_file(path):
-    with open(path, encoding="utf-8", errors="ignore") as f:
-        raw = clean_text(f.read())
+    raw = gutenberg.read_body(path).strip()
     blocks = [b.strip() for b in raw.split("\n\n") if b.count("\n") >= 2]
     haikus = {"5-7-5": [], "3-5-3": []}
     for block in blocks:
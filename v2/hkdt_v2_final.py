@@ -11,7 +11,7 @@ Features:
 - Optionally prints haikus live with --verbose
 """
 
-import re
+import sys
 import argparse
 import requests
 import json
@@ -19,36 +19,25 @@ from langdetect import detect, DetectorFactory
 from pathlib import Path
 from bs4 import BeautifulSoup
 from nltk.tokenize import word_tokenize
-from nltk.corpus import cmudict
 from tqdm import tqdm
-import nltk
 
-DetectorFactory.seed = 0
-nltk.download("punkt")
-nltk.download("cmudict")
-
-cmu_dict = cmudict.dict()
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import catalog
+import gutenberg
+from resources import ensure_nltk
+from syllables import count_syllables
 
-def count_syllables(word):
-    word = word.lower()
-    if word in cmu_dict:
-        return min(len([ph for ph in pron if ph[-1].isdigit()]) for pron in cmu_dict[word])
-    return len(re.findall(r"[aeiouy]+", word))
+DetectorFactory.seed = 0
+ensure_nltk("punkt")
 
 def get_metadata(book_id):
-    try:
-        url = f"https://www.gutenberg.org/ebooks/{book_id}"
-        soup = BeautifulSoup(requests.get(url).text, "html.parser")
-        title = soup.select_one("meta[name='title']").get("content", "").strip()
-        author = soup.select_one("meta[name='author']").get("content", "").strip()
-        return f"{author} - {title}".replace("/", "-").replace(":", "").strip()
-    except:
+    meta = catalog.metadata(book_id)
+    if not meta:
         return f"Unknown - {book_id}"
+    return f"{meta['author'] or 'Unknown'} - {meta['title']}".replace("/", "-").replace(":", "").strip()
 
 def clean_text(text):
-    start = re.search(r"\*\*\* START OF .*? \*\*\*", text)
-    end = re.search(r"\*\*\* END OF .*? \*\*\*", text)
-    return text[start.end():end.start()].strip() if start and end else text
+    return gutenberg.strip(text).strip()
 
 def download_and_clean(book_id, destination):
     urls = [f"https://www.gutenberg.org/files/{book_id}/{book_id}-0.txt",
@@ -82,68 +71,69 @@ def fetch_english_texts(path, target=100, top_n=200):
             break
     return downloaded
 
-def is_clean_line(line):
-    if not line or line.strip() == "":
-        return False
-    if len(line.split()) < 2:
+HAS_DIGIT, ALL_CAPS, HAS_LOWER = 1, 2, 4
+
+def token_flags(word):
+    flags = 0
+    if any(char.isdigit() for char in word):
+        flags |= HAS_DIGIT
+    if word.isupper():
+        flags |= ALL_CAPS
+    # like str.isupper(), titlecase letters such as 'ǅ' count as lowercase
+    if any(char.islower() or (char.istitle() and not char.isupper()) for char in word):
+        flags |= HAS_LOWER
+    return flags
+
+def is_clean_span(words, flags, start, end):
+    # words[start:end] as a line: 2+ words, no digits, not all caps, starts A-Z
+    if end - start < 2 or not "A" <= words[start][0] <= "Z":
         return False
-    if any(char.isdigit() for char in line):
+    combined = 0
+    for k in range(start, end):
+        combined |= flags[k]
+    if combined & HAS_DIGIT:
         return False
-    if line.isupper():
-        return False
-    if not re.match(r"^[A-Z]", line):
-        return False
-    return True
-
-def syllable_split(words, pattern):
-    lines, cursor = [], 0
+    return not (combined & ALL_CAPS and not combined & HAS_LOWER)
+
+def syllable_prefix(words):
+    # prefix[k] = syllables in words[:k]; first[total] = first k reaching that total
+    prefix, first = [0], {0: 0}
+    for k, word in enumerate(words, 1):
+        prefix.append(prefix[-1] + count_syllables(word))
+        first.setdefault(prefix[-1], k)
+    return prefix, first
+
+def syllable_split(words, prefix, first, flags, start, pattern):
+    bounds, cursor = [], start
     for target in pattern:
-        line, count = [], 0
-        while cursor < len(words):
-            word = words[cursor]
-            sc = count_syllables(word)
-            if count + sc > target:
-                return None
-            line.append(word)
-            count += sc
-            cursor += 1
-            if count == target:
-                break
-        if count != target:
-            return None
-        composed = " ".join(line).strip()
-        if not is_clean_line(composed):
+        end = first.get(prefix[cursor] + target)
+        if end is None or not is_clean_span(words, flags, cursor, end):
             return None
-        lines.append(composed)
-    return lines
+        bounds.append((cursor, end))
+        cursor = end
+    return [" ".join(words[a:b]).strip() for a, b in bounds]
 
 def detect_haikus(text, patterns, verbose=False):
     words = word_tokenize(text)
+    prefix, first = syllable_prefix(words)
+    flags = [token_flags(w) for w in words]
     haikus = { "5-7-5": [], "3-5-3": [] }
     for i in range(len(words)):
-        chunk = words[i:i+30]
         for pattern in patterns:
-            total = sum(pattern)
-            count, j = 0, 0
-            while j < len(chunk):
-                count += count_syllables(chunk[j])
-                if count == total:
-                    split = syllable_split(chunk[:j+1], pattern)
-                    if split:
-                        form = "-".join(map(str, pattern))
-                        haikus[form].append(split)
-                        if verbose:
-                            print(f"\n📜 {form} Haiku Found:\n" + "\n".join(split) + "\n" + "-"*30)
-                    break
-                elif count > total:
-                    break
-                j += 1
+            # the window must close within 30 words of i
+            end = first.get(prefix[i] + sum(pattern))
+            if end is None or end > i + 30:
+                continue
+            split = syllable_split(words, prefix, first, flags, i, pattern)
+            if split:
+                form = "-".join(map(str, pattern))
+                haikus[form].append(split)
+                if verbose:
+                    print(f"\n📜 {form} Haiku Found:\n" + "\n".join(split) + "\n" + "-"*30)
     return haikus
 
 def extract_haikus(file_path, verbose=False):
-    with open(file_path, encoding="utf-8", errors="ignore") as f:
-        text = f.read()
-    text = clean_text(text)
+    text = gutenberg.read_body(file_path).strip()
     return detect_haikus(text, [[5,7,5], [3,5,3]], verbose=verbose)
 
 def save_results(results, out_md, out_json=None):
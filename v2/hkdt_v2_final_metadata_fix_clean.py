@@ -5,6 +5,7 @@ hkdt_v2_final_metadata_fix.py — Accidental Haiku Detector (Final Fix)
 """
 
 import re
+import sys
 import argparse
 import requests
 import json
@@ -13,14 +14,16 @@ from langdetect import detect, DetectorFactory
 from pathlib import Path
 from bs4 import BeautifulSoup
 from nltk.tokenize import word_tokenize
-from nltk.corpus import cmudict
 from tqdm import tqdm
-import nltk
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import catalog
+import gutenberg
+from resources import ensure_nltk
+from syllables import count_syllables
 
 DetectorFactory.seed = 0
-nltk.download("punkt")
-nltk.download("cmudict")
-cmu_dict = cmudict.dict()
+ensure_nltk("punkt")
 
 deadpan_lines = [
     "Waiting for something vaguely syllabic to happen",
@@ -34,26 +37,14 @@ deadpan_lines = [
     "Giving syllables the side-eye"
 ]
 
-def count_syllables(word):
-    word = word.lower()
-    if word in cmu_dict:
-        return min(len([ph for ph in pron if ph[-1].isdigit()]) for pron in cmu_dict[word])
-    return len(re.findall(r"[aeiouy]+", word))
-
 def get_metadata(book_id):
-    try:
-        url = f"https://www.gutenberg.org/ebooks/{book_id}"
-        soup = BeautifulSoup(requests.get(url).text, "html.parser")
-        title = soup.select_one("meta[name='title']").get("content", "").strip()
-        author = soup.select_one("meta[name='author']").get("content", "").strip()
-        return author, title
-    except:
+    meta = catalog.metadata(book_id)
+    if not meta:
         return "Unknown", str(book_id)
+    return meta["author"] or "Unknown", meta["title"]
 
 def clean_text(text):
-    start = re.search(r"\*\*\* START OF .*? \*\*\*", text)
-    end = re.search(r"\*\*\* END OF .*? \*\*\*", text)
-    return text[start.end():end.start()].strip() if start and end else text
+    return gutenberg.strip(text).strip()
 
 def download_and_clean(book_id, destination, meta_map):
     urls = [f"https://www.gutenberg.org/files/{book_id}/{book_id}-0.txt",
@@ -153,9 +144,7 @@ def detect_haikus(text, patterns, verbose=False):
     return haikus
 
 def extract_haikus(file_path, verbose=False):
-    with open(file_path, encoding="utf-8", errors="ignore") as f:
-        text = f.read()
-    text = clean_text(text)
+    text = gutenberg.read_body(file_path).strip()
     return detect_haikus(text, [[5,7,5], [3,5,3]], verbose=verbose)
 
 def save_results(results, meta, out_md, out_json=None):
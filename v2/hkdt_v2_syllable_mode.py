@@ -9,7 +9,7 @@ Haiku detector that supports:
 - Markdown zine output grouped by form (5-7-5 and 3-5-3)
 """
 
-import re
+import sys
 import argparse
 import requests
 import json
@@ -17,36 +17,26 @@ from langdetect import detect, DetectorFactory
 from pathlib import Path
 from bs4 import BeautifulSoup
 from nltk.tokenize import word_tokenize
-from nltk.corpus import cmudict
 from tqdm import tqdm
-import nltk
 
-DetectorFactory.seed = 0
-nltk.download("punkt")
-nltk.download("cmudict")
-
-cmu_dict = cmudict.dict()
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import catalog
+import gutenberg
+import tokenizer_backends
+from resources import ensure_nltk
+from syllables import count_syllables
 
-def count_syllables(word):
-    word = word.lower()
-    if word in cmu_dict:
-        return min(len([ph for ph in pron if ph[-1].isdigit()]) for pron in cmu_dict[word])
-    return len(re.findall(r"[aeiouy]+", word))
+DetectorFactory.seed = 0
+ensure_nltk("punkt")
 
 def get_metadata(book_id):
-    try:
-        url = f"https://www.gutenberg.org/ebooks/{book_id}"
-        soup = BeautifulSoup(requests.get(url).text, "html.parser")
-        title = soup.select_one("meta[name='title']").get("content", "").strip()
-        author = soup.select_one("meta[name='author']").get("content", "").strip()
-        return f"{author} - {title}".replace("/", "-").replace(":", "").strip()
-    except:
+    meta = catalog.metadata(book_id)
+    if not meta:
         return f"Unknown - {book_id}"
+    return f"{meta['author'] or 'Unknown'} - {meta['title']}".replace("/", "-").replace(":", "").strip()
 
 def clean_text(text):
-    start = re.search(r"\*\*\* START OF .*? \*\*\*", text)
-    end = re.search(r"\*\*\* END OF .*? \*\*\*", text)
-    return text[start.end():end.start()].strip() if start and end else text
+    return gutenberg.strip(text).strip()
 
 def download_and_clean(book_id, destination):
     urls = [f"https://www.gutenberg.org/files/{book_id}/{book_id}-0.txt", f"https://www.gutenberg.org/files/{book_id}/{book_id}.txt"]
@@ -77,65 +67,59 @@ def fetch_english_texts(target_dir, required_count=100, top_n=200):
             break
     return downloaded
 
-def syllable_split(words, targets):
-    segments = []
-    cursor = 0
+def syllable_prefix(words):
+    # prefix[k] = syllables in words[:k]; first[total] = first k reaching that total
+    prefix, first = [0], {0: 0}
+    for k, word in enumerate(words, 1):
+        prefix.append(prefix[-1] + count_syllables(word))
+        first.setdefault(prefix[-1], k)
+    return prefix, first
+
+def syllable_split(words, prefix, first, start, targets):
+    # each line ends at the first word that brings it exactly to its target
+    bounds = []
+    cursor = start
     for target in targets:
-        line = []
-        sc = 0
-        while cursor < len(words):
-            word = words[cursor]
-            sylls = count_syllables(word)
-            if sc + sylls > target:
-                return None
-            line.append(word)
-            sc += sylls
-            cursor += 1
-            if sc == target:
-                break
-        if sc != target:
+        end = first.get(prefix[cursor] + target)
+        if end is None:
             return None
-        segments.append(" ".join(line))
-    return segments if len(segments) == 3 else None
+        bounds.append((cursor, end))
+        cursor = end
+    return [" ".join(words[a:b]) for a, b in bounds] if len(bounds) == 3 else None
 
-def find_word_haikus(text, patterns):
-    words = word_tokenize(text)
+def find_word_haikus(text, patterns, tokenize=word_tokenize):
+    words = tokenize(text)
+    prefix, first = syllable_prefix(words)
     haikus = {"5-7-5": [], "3-5-3": []}
     for i in range(len(words)):
-        chunk = words[i:i+30]
         for pattern in patterns:
-            total = sum(pattern)
-            count = 0
-            for j, w in enumerate(chunk):
-                count += count_syllables(w)
-                if count == total:
-                    window = chunk[:j+1]
-                    haiku = syllable_split(window, pattern)
-                    if haiku:
-                        label = "-".join(map(str, pattern))
-                        haikus[label].append(haiku)
-                    break
-                if count > total:
-                    break
+            # the window must close within 30 words of i
+            end = first.get(prefix[i] + sum(pattern))
+            if end is None or end > i + 30:
+                continue
+            haiku = syllable_split(words, prefix, first, i, pattern)
+            if haiku:
+                label = "-".join(map(str, pattern))
+                haikus[label].append(haiku)
     return haikus
 
-def find_line_haikus(text, patterns):
+def find_line_haikus(text, patterns, tokenize=word_tokenize):
     lines = [l.strip() for l in text.split("\n") if l.strip()]
     haikus = {"5-7-5": [], "3-5-3": []}
+    # each line is tokenized once; trios then compare a rolling window of counts
+    counts = [sum(count_syllables(w) for w in tokenize(line)) for line in lines]
     for i in range(len(lines) - 2):
-        trio = lines[i:i+3]
-        sylls = [sum(count_syllables(w) for w in word_tokenize(line)) for line in trio]
+        sylls = counts[i:i+3]
         for pattern in patterns:
             if sylls == pattern:
                 label = "-".join(map(str, pattern))
-                haikus[label].append(trio)
+                haikus[label].append(lines[i:i+3])
     return haikus
 
-def extract_haikus(path, mode):
-    with open(path, encoding="utf-8", errors="ignore") as f:
-        text = clean_text(f.read())
+def extract_haikus(path, mode, tokenize=word_tokenize):
+    text = gutenberg.read_body(path).strip()
     patterns = [[5, 7, 5], [3, 5, 3]]
-    return find_word_haikus(text, patterns) if mode == "word" else find_line_haikus(text, patterns)
+    return find_word_haikus(text, patterns, tokenize) if mode == "word" else find_line_haikus(text, patterns, tokenize)
 
 def save_results(results, out_md, out_json=None):
     with open(out_md, "w", encoding="utf-8") as f:
@@ -155,15 +139,17 @@ def main():
     p.add_argument("--output", default="/Users/tmbp/haiku_detector/results/haiku_zine.md", help="Markdown output")
     p.add_argument("--log", default=None, help="Optional JSON debug log")
     p.add_argument("--mode", choices=["line", "word"], default="line", help="Detection mode")
+    p.add_argument("--tokenizer", choices=["nltk", "regex"], default="nltk", help="Word tokenizer (regex is faster and skips punctuation)")
     args = p.parse_args()
 
+    tokenize = tokenizer_backends.regex_words if args.tokenizer == "regex" else word_tokenize
     path = Path(args.texts)
     books = fetch_english_texts(path)
 
     results = {}
     for fname in tqdm(books, desc="Scanning"):
         file_path = path / fname
-        haikus = extract_haikus(file_path, args.mode)
+        haikus = extract_haikus(file_path, args.mode, tokenize)
         if haikus["5-7-5"] or haikus["3-5-3"]:
             results[fname] = haikus
 